@@ -0,0 +1,328 @@
+"""Time the hot paths of World and the per-tick update, and write the results as JSON.
+
+    python3 benchmark.py --output bench_results.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+from classes.World import World, np
+from classes.Simulation import Simulation
+from simulate import scripted_commands
+
+FIELD_SIZES = ((700, 450), (2000, 2000))
+
+def _time_calls(setup, run, repeat):
+    """Run ``setup`` untimed and ``run(state)`` timed, ``repeat`` times; returns per-call ms."""
+    samples = []
+    for _ in range(repeat):
+        state = setup()
+        start = time.perf_counter()
+        run(state)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+def _stats(samples, per_call=1):
+    samples = [sample / per_call for sample in samples]
+    return {
+        "min_ms": min(samples),
+        "median_ms": statistics.median(samples),
+        "mean_ms": statistics.fmean(samples),
+        "max_ms": max(samples),
+        "samples": len(samples),
+    }
+
+def _walk(points, step=3):
+    """Expand a polyline into the 3-pixel steps Player.move records."""
+    path = [points[0]]
+    x, y = points[0]
+    for tx, ty in points[1:]:
+        while (x, y) != (tx, ty):
+            dx = (tx > x) - (tx < x)
+            dy = (ty > y) - (ty < y)
+            x = tx if dx and abs(tx - x) < step else x + dx * step
+            y = ty if dy and abs(ty - y) < step else y + dy * step
+            path.append((x, y))
+    return path
+
+def _incursion_scenarios(width, height):
+    """Incursions of increasing complexity; each returns (polyline, qix position) in field coordinates."""
+    rectangle = [(width // 4, 0), (width // 4, height // 3), (width // 2, height // 3), (width // 2, 0)]
+
+    steps = 12
+    staircase = [(width, height // 10)]
+    x, y = width, height // 10
+    for _ in range(steps):
+        x -= width // (2 * steps)
+        staircase.append((x, y))
+        y += height // (2 * steps)
+        staircase.append((x, y))
+    x -= width // (2 * steps)
+    staircase.extend([(x, y), (x, 0)])
+
+    near_full = [(width // 50, 0), (width // 50, height)]
+
+    return [
+        ("rectangle", rectangle, (width * 3 // 4, height * 3 // 4)),
+        ("staircase", staircase, (width // 4, height * 3 // 4)),
+        ("near_full_field", near_full, (width // 100, height // 2)),
+    ]
+
+def _record(world, points):
+    path = _walk([(world.x + x, world.y + y) for x, y in points])
+    world.start_incursion(*path[0])
+    for point in path[1:]:
+        world.add_to_incursion(*point)
+
+def bench_complete_incursion(repeat, engines):
+    results = []
+    for engine, options in engines.items():
+        for width, height in FIELD_SIZES:
+            for name, points, (qx, qy) in _incursion_scenarios(width, height):
+                def setup():
+                    world = World(0, 0, width, height, render=False, **options)
+                    _record(world, points)
+                    return world
+
+                def run(world):
+                    assert world.complete_incursion((qx, qy)), name
+
+                results.append({
+                    "benchmark": "complete_incursion",
+                    "params": {"scenario": name, "width": width, "height": height, "engine": engine},
+                    **_stats(_time_calls(setup, run, repeat)),
+                })
+    return results
+
+def _notched_world(width, height, notches):
+    """World whose top edge carries ``notches`` small rectangular claims (4 extra segments each)."""
+    world = World(0, 0, width, height, render=False)
+    spacing = max(12, width // (notches + 1))
+    for i in range(notches):
+        x = spacing // 2 + i * spacing
+        if x + 8 >= width:
+            break
+        _record(world, [(x, 0), (x, 10), (x + 6, 10), (x + 6, 0)])
+        world.complete_incursion((width // 2, height // 2))
+    return world
+
+def bench_edge_queries(repeat, queries=2000):
+    results = []
+    for width, height in FIELD_SIZES:
+        for notches in (0, 10, 40, 100):
+            world = _notched_world(width, height, notches)
+            rng = random.Random(notches)
+            points = []
+            for _ in range(queries):
+                x1, y1, x2, y2 = rng.choice(world.boundary_edges)
+                t = rng.random()
+                points.append((x1 + (x2 - x1) * t + rng.uniform(-4, 4), y1 + (y2 - y1) * t + rng.uniform(-4, 4)))
+
+            for name, query in (("is_point_on_edge", world.is_point_on_edge), ("snap_to_edge", world.snap_to_edge)):
+                def run(_):
+                    for x, y in points:
+                        query(x, y)
+
+                results.append({
+                    "benchmark": name,
+                    "params": {"width": width, "height": height, "segments": len(world.boundary_edges)},
+                    **_stats(_time_calls(lambda: None, run, repeat), per_call=queries),
+                })
+    return results
+
+def bench_incursion_collision(repeat, queries=2000):
+    results = []
+    width, height = FIELD_SIZES[0]
+    # Rungs are 3px apart, so ~140 turns fill the field height.
+    for turns in (10, 40, 140):
+        world = World(0, 0, width, height, render=False)
+        # Zigzag down the field so every vertex is a real turn.
+        rung = max(3, (height - 20) // turns)
+        points = [(width // 4, 0)]
+        for i in range(turns):
+            x = width // 4 if i % 2 else width * 3 // 4
+            y = min(height - 10, 10 + i * rung)
+            points.extend([(points[-1][0], y), (x, y)])
+        _record(world, points)
+        rng = random.Random(turns)
+        probes = [(rng.uniform(0, width), rng.uniform(0, height)) for _ in range(queries)]
+
+        def run(_):
+            for x, y in probes:
+                world.check_incursion_collision(x, y, threshold=15)
+
+        results.append({
+            "benchmark": "check_incursion_collision",
+            "params": {"trail_vertices": len(world.current_incursion)},
+            **_stats(_time_calls(lambda: None, run, repeat), per_call=queries),
+        })
+
+        # The same probes as enemy batches, tested against the player and the trail together.
+        for enemies in (2, 50, 300):
+            batches = [probes[i:i + enemies] for i in range(0, queries, enemies)]
+
+            # Swept runs move every enemy 20px over the tick.
+            for swept in (False, True):
+                starts = [[(x - 20, y) for x, y in batch] if swept else None for batch in batches]
+
+                def run_batch(_):
+                    for batch, previous in zip(batches, starts):
+                        world.check_enemy_collisions(batch, 15, (width // 2, height // 2), previous)
+
+                results.append({
+                    "benchmark": "check_enemy_collisions",
+                    "params": {"trail_vertices": len(world.current_incursion), "enemies": enemies, "swept": swept},
+                    **_stats(_time_calls(lambda: None, run_batch, repeat), per_call=len(batches)),
+                })
+    return results
+
+def bench_update_tick(repeat, ticks=2000):
+    """Headless ``Simulation.step`` (the body of ``Game.update``) driven by the simulate.py bot."""
+    samples = []
+    for sample in range(repeat):
+        simulation = Simulation(3, 50, 50, 700, 450, render=False, seed=sample)
+        commands = scripted_commands(simulation, random.Random(sample))
+        start = time.perf_counter()
+        while simulation.clock.ticks < ticks:
+            if simulation.step(next(commands)) != "PLAYING":
+                break
+        samples.append((time.perf_counter() - start) * 1000 / max(simulation.clock.ticks, 1))
+
+    return [{
+        "benchmark": "simulation_step",
+        "params": {"level": 3, "ticks": ticks},
+        **_stats(samples),
+    }]
+
+def bench_free_point_sampling(repeat, samples=2000):
+    """Qix target picks: raster span sampling and vector-engine polygon sampling, as the field fills up."""
+    results = []
+    width, height = FIELD_SIZES[0]
+    for claimed in (0.0, 0.5, 0.9, 0.98):
+        for engine, options in (("python", {}), ("vector", {"use_vector": True})):
+            world = World(0, 0, width, height, render=False, **options)
+            if claimed:
+                # Claim a full-height strip on the left; the Qix sits in what is left.
+                cut = int(width * claimed)
+                _record(world, [(cut, 0), (cut, height)])
+                world.complete_incursion((width - 5, height // 2))
+            rng = random.Random(claimed)
+            sample = world.sample_free_point
+
+            def run(_):
+                for _ in range(samples):
+                    sample(rng)
+
+            misses = sum(sample(rng) is None for _ in range(samples))
+            results.append({
+                "benchmark": "free_point_sampling",
+                "params": {"engine": engine, "claimed_pct": round(world.get_claimed_percentage(), 1)},
+                "miss_rate": misses / samples,
+                **_stats(_time_calls(lambda: None, run, repeat), per_call=samples),
+            })
+    return results
+
+def bench_sparc_update(repeat, ticks=500):
+    """Moving N Sparcs one tick, as objects and (with numpy) as a SparcPool."""
+    results = []
+    for pooled in ((False, True) if np is not None else (False,)):
+        for count in (2, 50, 300):
+            def setup():
+                return Simulation(3, 50, 50, 700, 450, render=False, seed=0, sparc_count=count, sparc_pool=pooled)
+
+            def run(simulation):
+                for _ in range(ticks):
+                    if simulation.sparc_pool is not None:
+                        simulation.sparc_pool.update()
+                    else:
+                        for sparc in simulation.sparcs:
+                            sparc.update()
+
+            results.append({
+                "benchmark": "sparc_update",
+                "params": {"sparcs": count, "pool": pooled},
+                **_stats(_time_calls(setup, run, repeat), per_call=ticks),
+            })
+    return results
+
+def bench_game_frame(repeat, frames=300):
+    """One ``Game.update`` plus ``Game.draw`` on a dummy display, if pygame is installed."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    try:
+        from main import Game
+    except ModuleNotFoundError:
+        return []
+
+    game = Game()
+    results = []
+    for name, frame in (("game_update", (game.update,)), ("game_frame", (game.update, game.draw))):
+        def setup():
+            game._init_level()
+            game.game_state = "PLAYING"
+
+        def run(_):
+            for _ in range(frames):
+                for call in frame:
+                    call()
+
+        results.append({
+            "benchmark": name,
+            "params": {"level": game.level, "frames": frames},
+            **_stats(_time_calls(setup, run, repeat), per_call=frames),
+        })
+    return results
+
+def _commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default="bench_results.json", help="where to write the JSON results")
+    parser.add_argument("--repeat", type=int, default=5, help="timed samples per benchmark")
+    args = parser.parse_args(argv)
+
+    engines = {
+        "python": {},
+        "runs": {"use_runs": True},
+        "vector": {"use_vector": True},
+    }
+    results = []
+    for bench in (
+        lambda: bench_complete_incursion(args.repeat, engines),
+        lambda: bench_edge_queries(args.repeat),
+        lambda: bench_incursion_collision(args.repeat),
+        lambda: bench_update_tick(args.repeat),
+        lambda: bench_free_point_sampling(args.repeat),
+        lambda: bench_sparc_update(args.repeat),
+        lambda: bench_game_frame(args.repeat),
+    ):
+        for result in bench():
+            results.append(result)
+            print(f"{result['benchmark']:<26} {json.dumps(result['params'])}: {result['median_ms']:.4f} ms", flush=True)
+
+    report = {
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__ if np is not None else None,
+        "results": results,
+    }
+    with open(args.output, "w") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
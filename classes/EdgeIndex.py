@@ -0,0 +1,146 @@
+import math
+
+class EdgeIndex:
+    """Uniform grid of buckets over boundary edges for near-constant-time edge queries."""
+
+    def __init__(self, edges, origin_x, origin_y, cell_size=16):
+        self.edges = []
+        self.origin_x = origin_x
+        self.origin_y = origin_y
+        self.cell_size = cell_size
+        self.cells = {}
+        self.min_cell = (0, 0)
+        self.max_cell = (-1, -1)
+
+        for edge in edges:
+            self.add(edge)
+
+    def add(self, edge):
+        """Append an edge and bucket it; returns its index."""
+        index = len(self.edges)
+        self.edges.append(edge)
+        x1, y1, x2, y2 = edge
+        cx1, cy1 = self._cell(min(x1, x2), min(y1, y2))
+        cx2, cy2 = self._cell(max(x1, x2), max(y1, y2))
+        for cy in range(cy1, cy2 + 1):
+            for cx in range(cx1, cx2 + 1):
+                self.cells.setdefault((cx, cy), []).append(index)
+
+        if index == 0:
+            self.min_cell = (cx1, cy1)
+            self.max_cell = (cx2, cy2)
+        else:
+            self.min_cell = (min(self.min_cell[0], cx1), min(self.min_cell[1], cy1))
+            self.max_cell = (max(self.max_cell[0], cx2), max(self.max_cell[1], cy2))
+        return index
+
+    def extend_last(self, edge):
+        """Replace the last edge with one whose bounding box contains the old one."""
+        index = len(self.edges) - 1
+        x1, y1, x2, y2 = self.edges[index]
+        old_cx1, old_cy1 = self._cell(min(x1, x2), min(y1, y2))
+        old_cx2, old_cy2 = self._cell(max(x1, x2), max(y1, y2))
+
+        self.edges[index] = edge
+        x1, y1, x2, y2 = edge
+        cx1, cy1 = self._cell(min(x1, x2), min(y1, y2))
+        cx2, cy2 = self._cell(max(x1, x2), max(y1, y2))
+        for cy in range(cy1, cy2 + 1):
+            for cx in range(cx1, cx2 + 1):
+                if old_cx1 <= cx <= old_cx2 and old_cy1 <= cy <= old_cy2:
+                    continue
+                self.cells.setdefault((cx, cy), []).append(index)
+
+        self.min_cell = (min(self.min_cell[0], cx1), min(self.min_cell[1], cy1))
+        self.max_cell = (max(self.max_cell[0], cx2), max(self.max_cell[1], cy2))
+
+    def _cell(self, x, y):
+        return (
+            math.floor((x - self.origin_x) / self.cell_size),
+            math.floor((y - self.origin_y) / self.cell_size),
+        )
+
+    def near(self, x, y, radius):
+        """Edges whose buckets overlap the square of ``radius`` around the point."""
+        return [self.edges[i] for i in self.near_indices(x, y, radius)]
+
+    def near_indices(self, x, y, radius):
+        """Ascending indices of the edges returned by ``near``."""
+        cx1, cy1 = self._cell(x - radius, y - radius)
+        cx2, cy2 = self._cell(x + radius, y + radius)
+        if cx1 == cx2 and cy1 == cy2:
+            return self.cells.get((cx1, cy1), ())
+
+        found = set()
+        for cy in range(max(cy1, self.min_cell[1]), min(cy2, self.max_cell[1]) + 1):
+            for cx in range(max(cx1, self.min_cell[0]), min(cx2, self.max_cell[0]) + 1):
+                found.update(self.cells.get((cx, cy), ()))
+        return sorted(found)
+
+    def nearest(self, x, y, max_t=1.0):
+        """``(index, t, point)`` of the closest edge, with the projection parameter clamped to ``max_t``.
+
+        Buckets are searched ring by ring outwards; ties go to the earliest edge, matching a linear
+        scan over ``edges``.
+        """
+        if not self.cells:
+            return None
+
+        cx, cy = self._cell(x, y)
+        reach = max(
+            abs(cx - self.min_cell[0]), abs(cx - self.max_cell[0]),
+            abs(cy - self.min_cell[1]), abs(cy - self.max_cell[1]),
+        )
+        best = None
+        best_dist = float("inf")
+        best_index = -1
+        seen = set()
+
+        for ring in range(reach + 1):
+            for key in self._ring(cx, cy, ring):
+                for index in self.cells.get(key, ()):
+                    if index in seen:
+                        continue
+                    seen.add(index)
+                    x1, y1, x2, y2 = self.edges[index]
+                    dx = x2 - x1
+                    dy = y2 - y1
+                    length_sq = dx * dx + dy * dy
+                    if length_sq == 0:
+                        continue
+                    t = ((x - x1) * dx + (y - y1) * dy) / length_sq
+                    t = max(0.0, min(max_t, t))
+                    proj_x = x1 + dx * t
+                    proj_y = y1 + dy * t
+                    dist_sq = (proj_x - x) ** 2 + (proj_y - y) ** 2
+                    if dist_sq < best_dist or (dist_sq == best_dist and index < best_index):
+                        best_dist = dist_sq
+                        best_index = index
+                        best = (index, t, (proj_x, proj_y))
+            # Buckets beyond this ring lie outside the searched square around the point.
+            if best is not None:
+                left = self.origin_x + (cx - ring) * self.cell_size
+                top = self.origin_y + (cy - ring) * self.cell_size
+                span = (2 * ring + 1) * self.cell_size
+                margin = min(x - left, left + span - x, y - top, top + span - y)
+                if best_dist < margin * margin:
+                    break
+        return best
+
+    def _ring(self, cx, cy, ring):
+        if ring == 0:
+            return [(cx, cy)]
+        min_x, min_y = self.min_cell
+        max_x, max_y = self.max_cell
+        keys = []
+        for x in range(max(cx - ring, min_x), min(cx + ring, max_x) + 1):
+            if min_y <= cy - ring <= max_y:
+                keys.append((x, cy - ring))
+            if min_y <= cy + ring <= max_y:
+                keys.append((x, cy + ring))
+        for y in range(max(cy - ring + 1, min_y), min(cy + ring - 1, max_y) + 1):
+            if min_x <= cx - ring <= max_x:
+                keys.append((cx - ring, y))
+            if min_x <= cx + ring <= max_x:
+                keys.append((cx + ring, y))
+        return keys
@@ -1,7 +1,32 @@
-import pygame
+import functools
 import math
 
+# Transparent colour of pre-rendered enemy sprites.
+SPRITE_COLORKEY = (255, 0, 255)
+
+@functools.lru_cache(maxsize=None)
+def hexagon_offsets(radius):
+    """Vertex offsets of a hexagon of ``radius``, computed once per size."""
+    offsets = []
+    for i in range(6):
+        angle = i * 60 * 3.14159 / 180
+        offsets.append((radius * math.cos(angle), radius * math.sin(angle)))
+    return tuple(offsets)
+
+@functools.lru_cache(maxsize=None)
+def ring_sprite(size, color, inner_color):
+    """Filled circle of ``size`` with an inner circle two pixels smaller, rendered once per size and colours."""
+    import pygame
+    sprite = pygame.Surface((2 * size + 1, 2 * size + 1))
+    sprite.fill(SPRITE_COLORKEY)
+    sprite.set_colorkey(SPRITE_COLORKEY)
+    pygame.draw.circle(sprite, color, (size, size), size)
+    pygame.draw.circle(sprite, inner_color, (size, size), size - 2)
+    return sprite
+
 class Enemy:
+    __slots__ = ("x", "y", "color", "size", "speed")
+    
     def __init__(self, x, y, color, size=5):
         self.x = x
         self.y = y
@@ -16,10 +41,18 @@ class Enemy:
         return math.sqrt((self.x - x) ** 2 + (self.y - y) ** 2)
     
     def check_collision(self, x, y, threshold=10):
-        return self.distance_to(x, y) < threshold
+        return (self.x - x) ** 2 + (self.y - y) ** 2 < threshold ** 2
+    
+    def get_bounds(self, radius=None, pos=None):
+        """Screen box (left, top, width, height) covering what draw() paints, at ``pos`` if given."""
+        x, y = pos or (self.x, self.y)
+        radius = (self.size if radius is None else radius) + 1
+        return (int(x) - radius, int(y) - radius, 2 * radius + 1, 2 * radius + 1)
     
-    def update(self, world):
+    def update(self, world=None, dt=1.0):
         pass
     
-    def draw(self, screen):
-        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.size)
+    def draw(self, screen, pos=None):
+        import pygame
+        x, y = pos or (self.x, self.y)
+        pygame.draw.circle(screen, self.color, (int(x), int(y)), self.size)
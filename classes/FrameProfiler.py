@@ -0,0 +1,86 @@
+import json
+import time
+from collections import deque
+
+# Phases in the order a frame runs them.
+PHASES = ("input", "player", "claim", "enemies", "collisions", "draw")
+
+class FrameProfiler:
+    """Per-phase frame timings in a ring buffer, plus claim events, dumpable as a Chrome trace."""
+
+    def __init__(self, capacity=600, timer=time.perf_counter):
+        self.timer = timer
+        self.frames = deque(maxlen=capacity)
+        self.claims = deque(maxlen=capacity)
+        self._frame_start = None
+        self._last_mark = None
+        self._phases = None
+        # Claim time already booked inside the phase currently being timed.
+        self._nested = 0.0
+        # Sorted frame totals for percentiles(), dropped whenever a frame is recorded.
+        self._sorted_totals = None
+
+    def begin_frame(self):
+        now = self.timer()
+        self._frame_start = now
+        self._last_mark = now
+        self._phases = dict.fromkeys(PHASES, 0.0)
+        self._nested = 0.0
+
+    def mark(self, phase):
+        """Book the time since the previous mark to ``phase``."""
+        if self._phases is None:
+            return
+        now = self.timer()
+        self._phases[phase] += now - self._last_mark - self._nested
+        self._last_mark = now
+        self._nested = 0.0
+
+    def record_claim(self, start, cells, vertices):
+        """Book a claim that began at ``start`` (a timer reading) and ended now."""
+        now = self.timer()
+        duration = now - start
+        self.claims.append((start, duration, cells, vertices))
+        if self._phases is not None:
+            self._phases["claim"] += duration
+            self._nested += duration
+
+    def end_frame(self):
+        if self._phases is None:
+            return
+        self.frames.append((self._frame_start, self.timer() - self._frame_start, self._phases))
+        self._phases = None
+        self._sorted_totals = None
+
+    def percentiles(self, *ps):
+        """Frame-time percentiles in milliseconds over the buffered frames, sorted once per recorded frame."""
+        if not self.frames:
+            return [0.0 for _ in ps]
+        if self._sorted_totals is None:
+            self._sorted_totals = sorted(total for _, total, _ in self.frames)
+        totals = self._sorted_totals
+        last = len(totals) - 1
+        return [totals[min(last, int(p / 100 * len(totals)))] * 1000 for p in ps]
+
+    def dump(self, path):
+        """Write the buffered frames and claims in Chrome trace event format (chrome://tracing, Perfetto)."""
+        events = []
+        for start, total, phases in self.frames:
+            events.append(_event("frame", start, total, tid=0))
+            offset = start
+            for phase in PHASES:
+                duration = phases[phase]
+                if phase != "claim" and duration > 0:
+                    events.append(_event(phase, offset, duration, tid=1))
+                offset += duration
+        for start, duration, cells, vertices in self.claims:
+            events.append(_event("claim", start, duration, tid=2, args={"cells": cells, "vertices": vertices}))
+
+        with open(path, "w") as handle:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, handle)
+
+def _event(name, start, duration, tid, args=None):
+    event = {"name": name, "ph": "X", "ts": start * 1e6, "dur": duration * 1e6, "pid": 0, "tid": tid}
+    if args:
+        event["args"] = args
+    return event
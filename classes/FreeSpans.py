@@ -0,0 +1,94 @@
+import bisect
+
+class FreeSpans:
+    """Free points of a class raster as per-row spans, for uniform sampling in O(log n).
+
+    Only the window ``left..right`` by ``top..bottom`` (inclusive) is tracked. Each row keeps
+    its span starts and the running count before each span; a Fenwick tree over the row
+    counts finds the row holding the k-th free point.
+    """
+
+    def __init__(self, left, top, right, bottom, free_class=0):
+        self.left = left
+        self.top = top
+        self.right = right
+        self.bottom = bottom
+        self.row_count = max(0, bottom - top + 1)
+        # Maps the free class to 0 and every other class to 1, so runs are found with bytes.find.
+        self._classify = bytes(0 if value == free_class else 1 for value in range(256))
+        self.starts = [[] for _ in range(self.row_count)]
+        self.offsets = [[] for _ in range(self.row_count)]
+        self.counts = [0] * self.row_count
+        self.total = 0
+        self._tree = [0] * (self.row_count + 1)
+
+    def update(self, raster, stride, first=None, last=None):
+        """Re-read rows ``first`` to ``last`` of ``raster``; all rows by default."""
+        if self.right < self.left:
+            return
+        first = self.top if first is None else max(first, self.top)
+        last = self.bottom if last is None else min(last, self.bottom)
+        for i in range(first - self.top, last - self.top + 1):
+            lo = (self.top + i) * stride + self.left
+            row = raster[lo:lo + self.right - self.left + 1].translate(self._classify)
+            runs = []
+            start = row.find(0)
+            while start >= 0:
+                end = row.find(1, start)
+                if end < 0:
+                    end = len(row)
+                runs.append((start + self.left, end + self.left))
+                start = row.find(0, end)
+            self._set_runs(i, runs)
+
+    def set_row(self, y, runs):
+        """Replace row ``y``'s free points with the sorted, disjoint ``(start, end)`` column runs."""
+        if self.top <= y <= self.bottom:
+            clipped = ((max(start, self.left), min(end, self.right + 1)) for start, end in runs)
+            self._set_runs(y - self.top, [(start, end) for start, end in clipped if start < end])
+
+    def sample(self, rng):
+        """Uniformly random free ``(column, row)``, or None when nothing is free."""
+        if self.total <= 0:
+            return None
+        k = rng.randrange(self.total)
+        i, k = self._find(k)
+        j = bisect.bisect_right(self.offsets[i], k) - 1
+        return (self.starts[i][j] + k - self.offsets[i][j], self.top + i)
+
+    def __len__(self):
+        return self.total
+
+    def _set_runs(self, i, runs):
+        starts = []
+        offsets = []
+        count = 0
+        for start, end in runs:
+            starts.append(start)
+            offsets.append(count)
+            count += end - start
+        self.starts[i] = starts
+        self.offsets[i] = offsets
+        self._add(i, count - self.counts[i])
+        self.counts[i] = count
+
+    def _add(self, i, delta):
+        if not delta:
+            return
+        self.total += delta
+        i += 1
+        while i <= self.row_count:
+            self._tree[i] += delta
+            i += i & -i
+
+    def _find(self, k):
+        """Row holding the ``k``-th free point (0-based), and ``k``'s offset within that row."""
+        i = 0
+        step = 1 << self.row_count.bit_length()
+        while step:
+            nxt = i + step
+            if nxt <= self.row_count and self._tree[nxt] <= k:
+                i = nxt
+                k -= self._tree[nxt]
+            step >>= 1
+        return i, k
@@ -0,0 +1,39 @@
+import bisect
+
+class Perimeter:
+    """Arc-length parameterization of the closed boundary, built once per boundary change."""
+
+    def __init__(self, edges, edge_index):
+        self.edges = edges
+        self.edge_index = edge_index
+        self.edge_lengths = []
+        self.cumulative_lengths = [0.0]
+        total = 0.0
+        for x1, y1, x2, y2 in edges:
+            length = ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
+            self.edge_lengths.append(length)
+            total += length
+            self.cumulative_lengths.append(total)
+        self.total = max(total, 1.0)
+
+    def locate(self, distance):
+        """``(edge index, t, x, y)`` of the point ``distance`` along the perimeter (wrapping)."""
+        distance %= self.total
+        # Last edge whose start is at or before distance; zero-length edges are skipped over.
+        index = bisect.bisect_right(self.cumulative_lengths, distance) - 1
+        if index >= len(self.edge_lengths):
+            index = len(self.edge_lengths) - 1 if distance == self.cumulative_lengths[-1] else 0
+
+        edge_length = self.edge_lengths[index] or 1.0
+        offset = distance - self.cumulative_lengths[index]
+        t = max(0.0, min(1.0, offset / edge_length))
+        x1, y1, x2, y2 = self.edges[index]
+        return index, t, x1 + (x2 - x1) * t, y1 + (y2 - y1) * t
+
+    def project(self, x, y, max_t=1.0):
+        """``(edge index, t, point, distance)`` of the closest perimeter point, or None without edges."""
+        hit = self.edge_index.nearest(x, y, max_t)
+        if hit is None:
+            return None
+        index, t, point = hit
+        return index, t, point, self.cumulative_lengths[index] + t * self.edge_lengths[index]
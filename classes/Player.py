@@ -1,6 +1,10 @@
-import pygame
-
 class Player:
+    __slots__ = (
+        "x", "y", "world", "size", "color", "hit_color", "hit_flash_end_time", "invulnerable_end_time",
+        "speed", "lives", "is_pushing", "push_start_pos", "last_edge_pos", "push_dir",
+        "last_push_move_time", "push_idle_timeout", "push_warning_delay", "edge_axis", "move_budget",
+    )
+    
     def __init__(self, x, y, world):
         self.x = x
         self.y = y
@@ -21,8 +25,27 @@ class Player:
         self.push_idle_timeout = 1500
         self.push_warning_delay = 0
         self.edge_axis = self._detect_edge_axis(x, y, default="horizontal")
+        # Reference steps of movement not yet taken; move() spends it in whole steps.
+        self.move_budget = 0.0
+
+    def move(self, dx, dy, qix_pos=None, dt=1.0):
+        """Move for ``dt`` reference steps; returns whether the last step attempted succeeded.
 
-    def move(self, dx, dy, qix_pos=None):
+        The player always moves ``speed`` pixels at a time, keeping the trail on the grid that
+        edge snapping and trail merging expect, and carries leftover fractions of a step over.
+        """
+        self.move_budget += dt
+        moved = False
+        while self.move_budget >= 1:
+            self.move_budget -= 1
+            moved = self._step(dx, dy, qix_pos)
+            if not moved:
+                # A blocked step does not bank movement for later.
+                self.move_budget = 0.0
+                break
+        return moved
+
+    def _step(self, dx, dy, qix_pos=None):
         new_x = self.x + dx * self.speed
         new_y = self.y + dy * self.speed
         move_dir = self._normalize_direction(dx, dy)
@@ -81,7 +104,7 @@ class Player:
             self.push_start_pos = (self.x, self.y)
             self.world.start_incursion(self.x, self.y)
             self.push_dir = None
-            self.last_push_move_time = pygame.time.get_ticks()
+            self.last_push_move_time = self.world.clock.get_ticks()
             self.world.set_incursion_warning(False)
             self._update_edge_axis_from_position(self.x, self.y)
 
@@ -111,7 +134,7 @@ class Player:
             self.world.set_incursion_warning(False)
     
     def lose_life(self):
-        now = pygame.time.get_ticks()
+        now = self.world.clock.get_ticks()
         if now < self.invulnerable_end_time:
             return False
         self.lives -= 1
@@ -126,7 +149,7 @@ class Player:
         return self.lives > 0
     
     def is_invulnerable(self):
-        return pygame.time.get_ticks() < self.invulnerable_end_time
+        return self.world.clock.get_ticks() < self.invulnerable_end_time
     
     def reset_position(self):
         self.x, self.y = self.last_edge_pos
@@ -135,10 +158,18 @@ class Player:
         self.push_dir = None
         self._update_edge_axis_from_position(self.x, self.y)
     
-    def draw(self, screen):
-        current_time = pygame.time.get_ticks()
+    def get_bounds(self, pos=None):
+        """Screen box (left, top, width, height) around the player circle, at ``pos`` if given."""
+        x, y = pos or (self.x, self.y)
+        radius = self.size + 1
+        return (int(x) - radius, int(y) - radius, 2 * radius + 1, 2 * radius + 1)
+    
+    def draw(self, screen, pos=None):
+        import pygame
+        x, y = pos or (self.x, self.y)
+        current_time = self.world.clock.get_ticks()
         draw_color = self.hit_color if current_time < self.hit_flash_end_time else self.color
-        pygame.draw.circle(screen, draw_color, (int(self.x), int(self.y)), self.size)
+        pygame.draw.circle(screen, draw_color, (int(x), int(y)), self.size)
         
         if self.is_pushing and self.push_start_pos:
             pygame.draw.circle(screen, (255, 200, 0), 
@@ -148,7 +179,7 @@ class Player:
         if not self.is_pushing:
             self.world.set_incursion_warning(False)
             return False
-        now = pygame.time.get_ticks() if current_time is None else current_time
+        now = self.world.clock.get_ticks() if current_time is None else current_time
         idle_time = now - self.last_push_move_time
         if idle_time >= self.push_idle_timeout:
             self._handle_idle_failure()
@@ -173,7 +204,7 @@ class Player:
         return True
     
     def _record_push_movement(self):
-        self.last_push_move_time = pygame.time.get_ticks()
+        self.last_push_move_time = self.world.clock.get_ticks()
         self.world.set_incursion_warning(False)
     
     def _handle_idle_failure(self):
@@ -0,0 +1,77 @@
+import bisect
+
+class PolygonSampler:
+    """Uniform random points inside a simple polygon, for engines without a cell raster.
+
+    The polygon, clipped to ``bounds`` ``(left, top, right, bottom)`` when given, is cut into
+    horizontal trapezoids between consecutive vertex heights, each split into two triangles;
+    a sample picks a triangle by area with one bisect.
+    """
+
+    def __init__(self, polygon, bounds=None):
+        if bounds is not None:
+            polygon = self._clip(polygon, bounds)
+        self.triangles = []
+        self.cumulative_areas = []
+        self.total = 0.0
+        edges = [
+            (x1, y1, x2, y2) for (x1, y1), (x2, y2) in zip(polygon, polygon[1:] + polygon[:1]) if y1 != y2
+        ]
+        heights = sorted({y for _, y in polygon})
+        for top, bottom in zip(heights, heights[1:]):
+            middle = (top + bottom) / 2
+            # Edges crossing the slab, left to right; inside lies between each even-odd pair.
+            crossing = sorted(
+                (self._x_at(edge, middle), edge) for edge in edges
+                if min(edge[1], edge[3]) <= top and max(edge[1], edge[3]) >= bottom
+            )
+            for (_, left), (_, right) in zip(crossing[::2], crossing[1::2]):
+                top_left = (self._x_at(left, top), top)
+                top_right = (self._x_at(right, top), top)
+                bottom_left = (self._x_at(left, bottom), bottom)
+                bottom_right = (self._x_at(right, bottom), bottom)
+                self._add(top_left, top_right, bottom_right)
+                self._add(top_left, bottom_right, bottom_left)
+
+    def sample(self, rng):
+        """Uniformly random ``(x, y)`` inside the polygon, or None when it has no area."""
+        if self.total <= 0:
+            return None
+        index = bisect.bisect_right(self.cumulative_areas, rng.random() * self.total)
+        (ax, ay), (bx, by), (cx, cy) = self.triangles[min(index, len(self.triangles) - 1)]
+        u = rng.random()
+        v = rng.random()
+        if u + v > 1:
+            u, v = 1 - u, 1 - v
+        return (ax + (bx - ax) * u + (cx - ax) * v, ay + (by - ay) * u + (cy - ay) * v)
+
+    def _add(self, a, b, c):
+        area = abs((b[0] - a[0]) * (c[1] - a[1]) - (c[0] - a[0]) * (b[1] - a[1])) / 2
+        if area > 0:
+            self.total += area
+            self.triangles.append((a, b, c))
+            self.cumulative_areas.append(self.total)
+
+    @staticmethod
+    def _clip(polygon, bounds):
+        """Sutherland-Hodgman clip to the rectangle; concave parts leave zero-area seams, which add nothing."""
+        left, top, right, bottom = bounds
+        for axis, limit, keep_below in ((0, left, False), (0, right, True), (1, top, False), (1, bottom, True)):
+            clipped = []
+            for start, end in zip(polygon[-1:] + polygon[:-1], polygon):
+                start_in = (start[axis] <= limit) == keep_below or start[axis] == limit
+                end_in = (end[axis] <= limit) == keep_below or end[axis] == limit
+                if start_in != end_in:
+                    t = (limit - start[axis]) / (end[axis] - start[axis])
+                    crossing = [start[0] + (end[0] - start[0]) * t, start[1] + (end[1] - start[1]) * t]
+                    crossing[axis] = limit
+                    clipped.append(tuple(crossing))
+                if end_in:
+                    clipped.append(end)
+            polygon = clipped
+        return polygon
+
+    @staticmethod
+    def _x_at(edge, y):
+        x1, y1, x2, y2 = edge
+        return x1 + (y - y1) * (x2 - x1) / (y2 - y1)
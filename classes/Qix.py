@@ -1,22 +1,35 @@
-import pygame
+import math
 import random
-from .Enemy import Enemy
+from .Enemy import Enemy, hexagon_offsets
 
 class Qix(Enemy):
-    def __init__(self, x, y, world):
+    __slots__ = ("world", "rng", "target", "target_timer", "min_target_time", "max_target_time")
+    
+    def __init__(self, x, y, world, rng=None):
         super().__init__(x, y, (255, 0, 0), size=8)
         self.world = world
+        self.rng = rng or random.Random(world.rng.getrandbits(64))
         self.speed = 1.5
         self.target = None
         self.target_timer = 0
         self.min_target_time = 45
         self.max_target_time = 120
     
-    def update(self, world=None):
+    def update(self, world=None, dt=1.0):
+        """Move for ``dt`` reference steps; ``speed`` and the target timers count reference steps.
+
+        Long ticks run as whole reference steps, so retargeting happens at the same game
+        time at any simulation rate.
+        """
         if not self.world:
             return
-        
-        self.target_timer -= 1
+        while dt > 0:
+            step = min(dt, 1.0)
+            self._advance(step)
+            dt -= step
+    
+    def _advance(self, dt):
+        self.target_timer -= dt
         if self.target is None or self.target_timer <= 0 or self._at_target():
             self._choose_new_target()
         
@@ -30,11 +43,10 @@ class Qix(Enemy):
             self._choose_new_target()
             return
         
-        dir_x /= max(distance, 1e-6)
-        dir_y /= max(distance, 1e-6)
-        
-        new_x = self.x + dir_x * self.speed
-        new_y = self.y + dir_y * self.speed
+        # Long ticks stop at the target instead of overshooting it.
+        step = min(self.speed * dt, distance) / distance
+        new_x = self.x + dir_x * step
+        new_y = self.y + dir_y * step
         
         if self.world.is_point_in_unclaimed_area(new_x, new_y):
             self.x = new_x
@@ -42,36 +54,22 @@ class Qix(Enemy):
         else:
             self._choose_new_target()
     
-    def draw(self, screen):
-        points = []
-        for i in range(6):
-            angle = i * 60 * 3.14159 / 180
-            px = self.x + self.size * 1.5 * pygame.math.Vector2(1, 0).rotate_rad(angle).x
-            py = self.y + self.size * 1.5 * pygame.math.Vector2(1, 0).rotate_rad(angle).y
-            points.append((px, py))
-        
-        if len(points) > 2:
-            pygame.draw.polygon(screen, self.color, points)
-        else:
-            super().draw(screen)
+    def get_bounds(self, pos=None):
+        return super().get_bounds(math.ceil(self.size * 1.5), pos)
+    
+    def draw(self, screen, pos=None):
+        import pygame
+        x, y = pos or (self.x, self.y)
+        points = [(x + dx, y + dy) for dx, dy in hexagon_offsets(self.size * 1.5)]
+        pygame.draw.polygon(screen, self.color, points)
     
     def reset_motion(self):
         self.target = None
-        self.target_timer = random.randint(self.min_target_time, self.max_target_time)
+        self.target_timer = self.rng.randint(self.min_target_time, self.max_target_time)
     
     def _choose_new_target(self):
-        attempts = 0
-        max_attempts = 50
-        target = None
-        while attempts < max_attempts:
-            tx = random.uniform(self.world.x + 10, self.world.x + self.world.width - 10)
-            ty = random.uniform(self.world.y + 10, self.world.y + self.world.height - 10)
-            if self.world.is_point_in_unclaimed_area(tx, ty):
-                target = (tx, ty)
-                break
-            attempts += 1
-        self.target = target
-        self.target_timer = random.randint(self.min_target_time, self.max_target_time)
+        self.target = self.world.sample_free_point(self.rng)
+        self.target_timer = self.rng.randint(self.min_target_time, self.max_target_time)
     
     def _at_target(self):
         if not self.target:
@@ -0,0 +1,128 @@
+import bisect
+
+class RunGrid:
+    """Set cells of a width x height grid kept as per-row runs.
+
+    Each row is a sorted flat list ``[start0, end0, start1, end1, ...]`` of half-open
+    runs; touching runs are merged, so a point query is one bisect.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.rows = [[] for _ in range(height)]
+        self.count = 0
+
+    def add(self, y, start, end):
+        """Set cells ``start``..``end - 1`` of row ``y``; returns how many were newly set."""
+        start = max(0, start)
+        end = min(self.width, end)
+        if start >= end:
+            return 0
+        row = self.rows[y]
+        if not row or row[-1] < start:
+            row += (start, end)
+            self.count += end - start
+            return end - start
+        i = bisect.bisect_left(row, start)
+        j = bisect.bisect_right(row, end)
+        # Odd positions fall inside (or touch) an existing run, which absorbs the new one.
+        new_start = row[i - 1] if i % 2 else start
+        new_end = row[j] if j % 2 else end
+        lo = i - i % 2
+        hi = j + j % 2
+        covered = sum(row[k + 1] - row[k] for k in range(lo, hi, 2))
+        row[lo:hi] = [new_start, new_end]
+        added = (new_end - new_start) - covered
+        self.count += added
+        return added
+
+    def remove(self, y, start, end):
+        """Clear cells ``start``..``end - 1`` of row ``y``; returns how many were set."""
+        start = max(0, start)
+        end = min(self.width, end)
+        if start >= end:
+            return 0
+        row = self.rows[y]
+        i = bisect.bisect_right(row, start)
+        j = bisect.bisect_left(row, end)
+        lo = i - i % 2
+        hi = j + j % 2
+        covered = sum(min(row[k + 1], end) - max(row[k], start) for k in range(lo, hi, 2))
+        # Runs cut by either end keep their outside part.
+        kept = []
+        if i % 2 and row[i - 1] < start:
+            kept += (row[i - 1], start)
+        if j % 2 and end < row[j]:
+            kept += (end, row[j])
+        row[lo:hi] = kept
+        self.count -= covered
+        return covered
+
+    def add_rect(self, x1, y1, x2, y2):
+        """Set the inclusive rectangle ``x1..x2`` by ``y1..y2``."""
+        for y in range(max(0, y1), min(self.height - 1, y2) + 1):
+            self.add(y, x1, x2 + 1)
+
+    def contains(self, x, y):
+        return bisect.bisect_right(self.rows[y], x) % 2 == 1
+
+    def runs(self, y):
+        """``(start, end)`` pairs of row ``y``."""
+        row = self.rows[y]
+        return list(zip(row[::2], row[1::2]))
+
+    def gap(self, y, x):
+        """``(start, end)`` of the unset cells around ``x`` in row ``y``, or None when ``x`` is set."""
+        row = self.rows[y]
+        i = bisect.bisect_right(row, x)
+        if i % 2:
+            return None
+        return (row[i - 1] if i else 0, row[i] if i < len(row) else self.width)
+
+    def gaps(self, y, start, end):
+        """``(start, end)`` pairs of the unset cells of row ``y`` within ``start``..``end - 1``."""
+        row = self.rows[y]
+        i = bisect.bisect_right(row, start)
+        if i % 2:
+            start = row[i]
+            i += 1
+        gaps = []
+        while start < end:
+            stop = min(row[i], end) if i < len(row) else end
+            if start < stop:
+                gaps.append((start, stop))
+            if i >= len(row):
+                break
+            start = row[i + 1]
+            i += 2
+        return gaps
+
+    def row_bytes(self, y):
+        data = bytearray(self.width)
+        row = self.rows[y]
+        for k in range(0, len(row), 2):
+            data[row[k]:row[k + 1]] = b"\x01" * (row[k + 1] - row[k])
+        return data
+
+    def __getitem__(self, y):
+        return _RunRow(self, y)
+
+    def __iter__(self):
+        for y in range(self.height):
+            yield self.row_bytes(y)
+
+    def __len__(self):
+        return self.height
+
+class _RunRow:
+    """``grid[y][x]`` read access into a RunGrid row."""
+
+    __slots__ = ("grid", "y")
+
+    def __init__(self, grid, y):
+        self.grid = grid
+        self.y = y
+
+    def __getitem__(self, x):
+        return 1 if self.grid.contains(x, self.y) else 0
@@ -0,0 +1,185 @@
+import random
+from collections import Counter, namedtuple
+from .World import World
+from .Player import Player
+from .Qix import Qix
+from .Sparc import Sparc
+from .SparcPool import SparcPool
+from .TickClock import TickClock
+
+# One tick of player input: a unit move (dx wins over dy) and whether to start a push.
+Command = namedtuple("Command", ["dx", "dy", "push"], defaults=(0, 0, False))
+IDLE = Command()
+
+class Simulation:
+    """Game logic for one level, advanced one fixed tick per step() with no display or input devices.
+
+    The tick length is ``clock.step_ms``; entities move by ``clock.step_scale()`` reference steps
+    per tick, so a coarser clock covers the same game time in fewer steps.
+    """
+
+    def __init__(self, level, x, y, width, height, clock=None, render=None, seed=None,
+                 profiler=None, use_runs=False, use_vector=False, sparc_count=None, sparc_pool=False,
+                 swept_collisions=None):
+        self.level = level
+        self.seed = seed
+        self.clock = clock or TickClock()
+        self.state = "PLAYING"
+        # Lives lost this level, keyed by what took them.
+        self.deaths = Counter()
+        self.world = World(
+            x, y, width, height,
+            clock=self.clock, render=render, rng=random.Random(seed), use_runs=use_runs,
+            use_vector=use_vector,
+        )
+        # Optional FrameProfiler; step() marks its player/enemies/collisions phases.
+        self.profiler = profiler
+        self.world.profiler = profiler
+        self.dt = self.clock.step_scale()
+        # Swept tests catch contacts between tick positions, so fast enemies cannot tunnel.
+        # By default they are on when ticks are longer than the reference step.
+        if swept_collisions is None:
+            swept_collisions = self.dt > 1
+        self.world.swept_collisions = swept_collisions
+        self.player = Player(x, y, self.world)
+        
+        center_x = x + width * 3 // 4
+        center_y = y + height * 3 // 4
+        self.qix = Qix(center_x, center_y, self.world)
+        
+        # sparc_count overrides the level's Sparcs for stress runs; sparc_pool moves them as one array.
+        num_sparcs = sparc_count if sparc_count is not None else (1 if level <= 2 else 2)
+        right_edge_x = x + width
+        bottom_edge_y = y + height
+        vertical_spacing = max(1, height // (num_sparcs + 1))
+        positions = [(right_edge_x, bottom_edge_y - i * vertical_spacing) for i in range(num_sparcs)]
+        directions = [1 if i == 0 else -1 for i in range(num_sparcs)]
+        self.sparc_pool = None
+        if sparc_pool:
+            self.sparc_pool = SparcPool(self.world, positions, directions)
+            self.sparcs = self.sparc_pool.sparcs
+        else:
+            self.sparcs = [
+                Sparc(sparc_x, sparc_y, self.world, direction=direction)
+                for (sparc_x, sparc_y), direction in zip(positions, directions)
+            ]
+        
+        self.target_percentage = min(12.5 * level, 62.5)
+        qix_base_speed = 1.5
+        qix_increment = 0.25
+        self.qix.speed = qix_base_speed + (level - 1) * qix_increment
+        self.qix.reset_motion()
+        
+        sparc_base_speed = 1.4
+        sparc_increment = 0.15
+        for sparc in self.sparcs:
+            sparc.speed = sparc_base_speed + (level - 1) * sparc_increment
+    
+    def step(self, command=IDLE):
+        """Advance one tick and return the resulting state."""
+        if self.state != "PLAYING":
+            return self.state
+        
+        if command.push:
+            self.player.start_push()
+        
+        swept = self.world.swept_collisions
+        if swept:
+            boundary_version = self.world.boundary_version
+            player_start = self.player.get_position()
+            enemy_starts = [self.qix.get_position()] + self._sparc_positions()
+        
+        dx = command.dx
+        dy = command.dy if dx == 0 else 0
+        moved = False
+        if dx != 0 or dy != 0:
+            lives = self.player.lives
+            qix_pos = self.qix.get_position()
+            moved = self.player.move(dx, dy, qix_pos, dt=self.dt)
+            self._record_death(lives, "trail_crossed")
+        
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.mark("player")
+        
+        self.qix.update(dt=self.dt)
+        if self.sparc_pool is not None:
+            self.sparc_pool.update(self.dt)
+        else:
+            for sparc in self.sparcs:
+                sparc.update(dt=self.dt)
+        if profiler is not None:
+            profiler.mark("enemies")
+        
+        lives = self.player.lives
+        if swept:
+            # A failed push teleports the player and a claim re-seats enemies on the new boundary;
+            # those jumps are not motion, so sweep only real moves.
+            if not moved:
+                player_start = None
+            if self.world.boundary_version != boundary_version:
+                enemy_starts = None
+            cause = self._check_collisions(player_start, enemy_starts)
+        else:
+            cause = self._check_collisions()
+        self._record_death(lives, cause)
+        
+        lives = self.player.lives
+        self.player.check_push_idle()
+        self._record_death(lives, "idle_timeout")
+        
+        if not self.player.is_alive():
+            self.state = "GAME_OVER"
+        
+        claimed_percentage = self.world.get_claimed_percentage()
+        if claimed_percentage >= self.target_percentage:
+            self.state = "LEVEL_COMPLETE"
+        if profiler is not None:
+            profiler.mark("collisions")
+        
+        self.clock.tick()
+        return self.state
+    
+    def _record_death(self, lives_before, cause):
+        if self.player.lives < lives_before:
+            self.deaths[cause] += lives_before - self.player.lives
+    
+    def _check_collisions(self, player_start=None, enemy_starts=None):
+        """Resolve enemy contact for this tick; returns the cause name of any hit.
+
+        ``enemy_starts`` (Qix first, then Sparcs) and ``player_start`` are positions at the start
+        of the tick; given either, contacts are swept over the tick's moves.
+        """
+        player = self.player
+        player_pos = player.get_position()
+        # Off the trail only Sparcs can hurt the player; while pushing the Qix and the trail count too.
+        if player.is_pushing:
+            enemies = [self.qix] + self.sparcs
+            positions = [self.qix.get_position()] + self._sparc_positions()
+            thresholds = [15] + [10] * len(self.sparcs)
+        else:
+            enemies = self.sparcs
+            positions = self._sparc_positions()
+            thresholds = 10
+            if enemy_starts is not None:
+                enemy_starts = enemy_starts[1:]
+        if enemy_starts is None and player_start is not None:
+            enemy_starts = positions
+        hits = self.world.check_enemy_collisions(
+            positions, thresholds, player_pos, previous_positions=enemy_starts, previous_player_pos=player_start
+        )
+        if not hits:
+            return None
+        
+        index, target = hits[0]
+        if player.is_pushing:
+            player.cancel_push()
+        elif player.lose_life():
+            player.reset_position()
+        enemy = "qix" if enemies[index] is self.qix else "sparc"
+        return f"{enemy}_hit_{target}"
+    
+    def _sparc_positions(self):
+        if self.sparc_pool is not None:
+            return self.sparc_pool.positions()
+        return [sparc.get_position() for sparc in self.sparcs]
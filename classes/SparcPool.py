@@ -0,0 +1,103 @@
+from .Sparc import Sparc
+
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    np = None
+
+class SparcPool:
+    """Sparcs kept as parallel NumPy arrays and moved along ``world.perimeter`` in one pass.
+
+    ``sparcs`` holds one PooledSparc view per row, for drawing and collision code that
+    works with individual enemies.
+    """
+
+    def __init__(self, world, positions, directions, size=5, color=(255, 165, 0)):
+        if np is None:
+            raise ModuleNotFoundError("numpy is required for SparcPool")
+        self.world = world
+        count = len(positions)
+        self.xs = np.array([float(x) for x, _ in positions])
+        self.ys = np.array([float(y) for _, y in positions])
+        self.speed = np.full(count, 1.5)
+        self.direction = np.array([1.0 if direction >= 0 else -1.0 for direction in directions])
+        self.path_distance = np.zeros(count)
+        self.edge_index = np.zeros(count, dtype=np.intp)
+        self.t = np.zeros(count)
+        self.boundary_version = None
+        self._attach_to_edges()
+        self.sparcs = [PooledSparc(self, i, size, color) for i in range(count)]
+
+    def _attach_to_edges(self):
+        """Re-project every Sparc onto the current perimeter; runs once per boundary change."""
+        perimeter = self.world.perimeter
+        for i in range(len(self.xs)):
+            hit = perimeter.project(self.xs[i], self.ys[i], max_t=0.999)
+            if hit is None:
+                self.edge_index[i] = 0
+                self.t[i] = 0.0
+                continue
+            self.edge_index[i], self.t[i], (self.xs[i], self.ys[i]), self.path_distance[i] = hit
+
+        edges = np.array(perimeter.edges, dtype=float).reshape(-1, 4)
+        self._starts = edges[:, :2]
+        self._deltas = edges[:, 2:] - edges[:, :2]
+        lengths = np.array(perimeter.edge_lengths)
+        self._lengths = np.where(lengths == 0, 1.0, lengths)
+        self._cumulative = np.array(perimeter.cumulative_lengths)
+        self.boundary_version = self.world.boundary_version
+
+    def positions(self):
+        """``(x, y)`` of every Sparc, as plain floats."""
+        return list(zip(self.xs.tolist(), self.ys.tolist()))
+
+    def update(self, dt=1.0):
+        """``dt`` reference steps for every Sparc: the array form of Sparc.update and Perimeter.locate."""
+        if not self.world.get_boundary_edges() or not len(self.xs):
+            return
+        if self.boundary_version != self.world.boundary_version:
+            self._attach_to_edges()
+
+        distance = (self.path_distance + self.speed * self.direction * dt) % self.world.perimeter.total
+        self.path_distance = distance
+        cumulative = self._cumulative
+        edge_count = len(self._lengths)
+        index = np.searchsorted(cumulative, distance, side="right") - 1
+        past_end = index >= edge_count
+        if past_end.any():
+            index[past_end] = np.where(distance[past_end] == cumulative[-1], edge_count - 1, 0)
+
+        t = np.clip((distance - cumulative[index]) / self._lengths[index], 0.0, 1.0)
+        self.edge_index = index
+        self.t = t
+        self.xs = self._starts[index, 0] + self._deltas[index, 0] * t
+        self.ys = self._starts[index, 1] + self._deltas[index, 1] * t
+
+class PooledSparc(Sparc):
+    """One SparcPool row seen as a Sparc; the pool moves it, so update() does nothing."""
+
+    __slots__ = ("pool", "index")
+
+    def __init__(self, pool, index, size, color):
+        self.pool = pool
+        self.index = index
+        self.size = size
+        self.color = color
+
+    x = property(lambda self: float(self.pool.xs[self.index]))
+    y = property(lambda self: float(self.pool.ys[self.index]))
+
+    @property
+    def speed(self):
+        return float(self.pool.speed[self.index])
+
+    @speed.setter
+    def speed(self, value):
+        self.pool.speed[self.index] = value
+
+    @property
+    def path_distance(self):
+        return float(self.pool.path_distance[self.index])
+
+    def update(self, world=None, dt=1.0):
+        pass
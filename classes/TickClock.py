@@ -0,0 +1,19 @@
+# Length of the step that entity speeds and tick timers are tuned for (one 60 Hz frame).
+REFERENCE_STEP_MS = 1000 / 60
+
+class TickClock:
+    """Millisecond clock that only moves when the simulation steps it."""
+
+    def __init__(self, step_ms=REFERENCE_STEP_MS):
+        self.step_ms = step_ms
+        self.ticks = 0
+
+    def tick(self, steps=1):
+        self.ticks += steps
+
+    def get_ticks(self):
+        return int(self.ticks * self.step_ms)
+
+    def step_scale(self):
+        """Length of one tick in reference steps; the ``dt`` that entity updates take."""
+        return self.step_ms / REFERENCE_STEP_MS
@@ -1,25 +1,185 @@
-import pygame
+import bisect
+import math
+import random
 from collections import deque
+from .EdgeIndex import EdgeIndex
+from .FreeSpans import FreeSpans
+from .Perimeter import Perimeter
+from .PolygonSampler import PolygonSampler
+from .RunGrid import RunGrid
+from .TickClock import TickClock
+
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    np = None
+
+# Per-point classes stored in World.area_raster
+AREA_FREE = 0
+AREA_BLOCKED = 1
+AREA_EDGE = 2
+
+# Trail segments shorter than 0.1px are ignored by collision tests (compared squared).
+MIN_SEGMENT_LENGTH_SQUARED = 0.01
+# Below this many enemies check_enemy_collisions loops in Python; NumPy's call overhead would dominate.
+BATCH_COLLISION_MIN_ENEMIES = 8
+# Most recorded steps collision checks may skip at the trail's tail; World keeps one more raw step than this.
+MAX_SKIP_TAIL_SEGMENTS = 7
+
+# sample_free_point keeps this far inside the field, as Qix targets always have.
+FREE_SAMPLE_MARGIN = 10
+
+# Transparent colour of World.static_surface outside the field and its boundary.
+STATIC_COLORKEY = (255, 0, 255)
+
+def _bounds(points, pad):
+    """Integer (left, top, width, height) box around ``points``, grown by ``pad`` on every side."""
+    xs = [point[0] for point in points]
+    ys = [point[1] for point in points]
+    left = math.floor(min(xs)) - pad
+    top = math.floor(min(ys)) - pad
+    return (left, top, math.ceil(max(xs)) + pad + 1 - left, math.ceil(max(ys)) + pad + 1 - top)
+
+def _point_segment_distance_squared(px, py, x1, y1, x2, y2):
+    length_squared = (x2 - x1) ** 2 + (y2 - y1) ** 2
+    if length_squared == 0:
+        return (px - x1) ** 2 + (py - y1) ** 2
+    dot = ((px - x1) * (x2 - x1) + (py - y1) * (y2 - y1)) / length_squared
+    dot = max(0, min(1, dot))
+    closest_x = x1 + dot * (x2 - x1)
+    closest_y = y1 + dot * (y2 - y1)
+    return (px - closest_x) ** 2 + (py - closest_y) ** 2
+
+def _segments_distance_squared(ax, ay, bx, by, cx, cy, dx, dy):
+    """Squared distance between segments AB and CD; 0 when they cross."""
+    side_a = (dx - cx) * (ay - cy) - (dy - cy) * (ax - cx)
+    side_b = (dx - cx) * (by - cy) - (dy - cy) * (bx - cx)
+    side_c = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+    side_d = (bx - ax) * (dy - ay) - (by - ay) * (dx - ax)
+    if side_a * side_b < 0 and side_c * side_d < 0:
+        return 0.0
+    # Otherwise the closest pair includes an endpoint (touching and collinear overlaps give 0 here).
+    return min(
+        _point_segment_distance_squared(ax, ay, cx, cy, dx, dy),
+        _point_segment_distance_squared(bx, by, cx, cy, dx, dy),
+        _point_segment_distance_squared(cx, cy, ax, ay, bx, by),
+        _point_segment_distance_squared(dx, dy, ax, ay, bx, by),
+    )
+
+def _np_point_segment_distance_squared(px, py, x1, y1, dx, dy, length_squared):
+    """Array form of _point_segment_distance_squared for segments given as start and (dx, dy)."""
+    dot = np.clip(((px - x1) * dx + (py - y1) * dy) / np.maximum(length_squared, MIN_SEGMENT_LENGTH_SQUARED), 0.0, 1.0)
+    return (px - (x1 + dot * dx)) ** 2 + (py - (y1 + dot * dy)) ** 2
+
+def _np_segments_distance_squared(ax, ay, adx, ady, alength, cx, cy, cdx, cdy, clength):
+    """Array form of _segments_distance_squared, broadcasting segments A against segments C."""
+    bx = ax + adx
+    by = ay + ady
+    dx = cx + cdx
+    dy = cy + cdy
+    squared = np.minimum(
+        np.minimum(
+            _np_point_segment_distance_squared(ax, ay, cx, cy, cdx, cdy, clength),
+            _np_point_segment_distance_squared(bx, by, cx, cy, cdx, cdy, clength),
+        ),
+        np.minimum(
+            _np_point_segment_distance_squared(cx, cy, ax, ay, adx, ady, alength),
+            _np_point_segment_distance_squared(dx, dy, ax, ay, adx, ady, alength),
+        ),
+    )
+    crossing = (
+        (cdx * (ay - cy) - cdy * (ax - cx)) * (cdx * (by - cy) - cdy * (bx - cx)) < 0
+    ) & (
+        (adx * (cy - ay) - ady * (cx - ax)) * (adx * (dy - ay) - ady * (dx - ax)) < 0
+    )
+    return np.where(crossing, 0.0, squared)
 
 class World:
-    def __init__(self, x, y, width, height):
+    def __init__(self, x, y, width, height, clock=None, render=None, rng=None, use_runs=False, use_vector=False):
         self.x = x
         self.y = y
         self.width = int(width)
         self.height = int(height)
+        # use_runs keeps claimed, blocked and wall cells as per-row runs (RunGrid) instead of full
+        # rows, and derives free spans from the runs rather than from a per-point area raster.
+        # use_vector keeps no cell grids at all: claims split boundary_path and area comes from
+        # the polygon, so cost is independent of the field's resolution.
+        if use_runs and use_vector:
+            raise ValueError("use_runs and use_vector are alternative grid engines")
+        self.use_runs = bool(use_runs)
+        self.use_vector = bool(use_vector)
+        self.clock = clock or TickClock()
+        # Seeded random.Random for reproducible runs; entities derive their own streams from it.
+        self.rng = rng or random.Random()
         
-        self.claim_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        self.claim_surface.fill((0, 0, 0, 0))
-        self.claimed_grid = [bytearray(self.width) for _ in range(self.height)]
-        self.blocked_grid = [bytearray(self.width) for _ in range(self.height)]
+        # Headless worlds (render=False, or no pygame) skip painting claim_surface and never
+        # import pygame; drawing code imports it where it is used.
+        self.claim_surface = None
+        if render is not False:
+            try:
+                import pygame
+            except ModuleNotFoundError:
+                if render:
+                    raise
+            else:
+                self.claim_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+                self.claim_surface.fill((0, 0, 0, 0))
+        if self.use_vector:
+            self.claimed_grid = None
+            self.blocked_grid = None
+        elif self.use_runs:
+            self.claimed_grid = RunGrid(self.width, self.height)
+            self.blocked_grid = RunGrid(self.width, self.height)
+        else:
+            self.claimed_grid = [bytearray(self.width) for _ in range(self.height)]
+            self.blocked_grid = [bytearray(self.width) for _ in range(self.height)]
+        # Claimed cells plus the rasterized boundary, kept up to date claim by claim.
+        if self.use_vector:
+            self.wall_grid = None
+        elif self.use_runs:
+            self.wall_grid = RunGrid(self.width, self.height)
+        else:
+            self.wall_grid = [bytearray(self.width) for _ in range(self.height)]
         self.claimed_area = 0
+        self.claim_count = 0
         self.boundary_path = []
         self.boundary_edges = []
+        self.edge_index = None
+        # Arc-length model of the boundary shared by Sparcs and edge snapping.
+        self.perimeter = None
+        # EdgeIndex buckets: 16px on playable fields, coarser on huge vector-mode fields.
+        self.edge_cell_size = max(16, (self.width + self.height) // 256)
+        # One class byte per integer point of the field, row stride width + 1; empty with use_runs.
+        self.area_raster = bytearray()
+        # Free raster points as row spans for sample_free_point; the vector engine samples the
+        # boundary polygon instead, rebuilt when boundary_version moves.
+        self.free_spans = None
+        self._polygon_sampler = None
+        self._polygon_sampler_version = None
+        if not self.use_vector:
+            self.free_spans = FreeSpans(
+                FREE_SAMPLE_MARGIN, FREE_SAMPLE_MARGIN, self.width - FREE_SAMPLE_MARGIN,
+                self.height - FREE_SAMPLE_MARGIN, free_class=AREA_FREE,
+            )
         self.boundary_version = 0
+        # Field, claims and boundary pre-composited for draw(); rebuilt when boundary_version moves.
+        self.static_surface = None
+        self._static_version = None
+        # Screen area touched by the latest claim, for dirty-rect redraws.
+        self.last_claim_bounds = None
+        # Old boundary cells cut off by the latest claim, as local (y, x); like the full-grid
+        # fill they replace, they are only claimed by the next successful claim.
+        self._pending_arc_cells = set()
+        # Row spans of those cells released into the latest claim, (y, start, end).
+        self._released_arc_spans = []
         self.incursion_warning = False
+        # Optional FrameProfiler that gets a claim event per completed incursion.
+        self.profiler = None
+        # Sweep collision tests over each move instead of testing end positions only.
+        self.swept_collisions = False
         self._initialize_boundary()
         
-        self.current_incursion = []
+        self._clear_incursion()
         
     def _initialize_boundary(self):
         self.boundary_path = [
@@ -28,6 +188,12 @@ class World:
             (self.x + self.width, self.y + self.height),
             (self.x, self.y + self.height)
         ]
+        if not self.use_vector:
+            for x, y in self._polyline_cells(self.boundary_path + self.boundary_path[:1]):
+                if self.use_runs:
+                    self.wall_grid.add(y, x, x + 1)
+                else:
+                    self.wall_grid[y][x] = 1
         self._update_boundary_edges()
     
     def _update_boundary_edges(self):
@@ -36,7 +202,104 @@ class World:
             x1, y1 = self.boundary_path[i]
             x2, y2 = self.boundary_path[(i + 1) % len(self.boundary_path)]
             self.boundary_edges.append((x1, y1, x2, y2))
+        self.edge_index = EdgeIndex(self.boundary_edges, self.x, self.y, self.edge_cell_size)
+        self.perimeter = Perimeter(self.boundary_edges, self.edge_index)
+        if self.use_vector:
+            self.claimed_area = self.width * self.height - abs(self._signed_area(self.boundary_path))
+        elif self.use_runs:
+            self._refresh_free_runs()
+        else:
+            self._refresh_area_raster()
         self.boundary_version += 1
+    
+    def _refresh_area_raster(self, tolerance=3):
+        """Rebuild area_raster from blocked cells and edge bands, patching it in place after a claim.
+
+        Only rows within reach of the latest claim's bounds are rewritten and re-read into free_spans.
+        """
+        stride = self.width + 1
+        top, bottom = 0, self.height
+        if self.last_claim_bounds is None or not self.area_raster:
+            self.area_raster = bytearray(stride * (self.height + 1))
+        else:
+            _, claim_top, _, claim_height = self.last_claim_bounds
+            top = max(top, claim_top - self.y - tolerance - 1)
+            bottom = min(bottom, claim_top - self.y + claim_height + tolerance)
+            if bottom < top:
+                return
+        raster = self.area_raster
+        # The last column and row repeat their neighbours, for points on the field's far edges.
+        for row in range(top, bottom + 1):
+            cells = self.blocked_grid[min(row, self.height - 1)]
+            lo = row * stride
+            raster[lo:lo + self.width] = cells
+            raster[lo + self.width] = cells[-1]
+        for edge in self.boundary_edges:
+            if min(edge[1], edge[3]) - self.y - tolerance <= bottom and max(edge[1], edge[3]) - self.y + tolerance >= top:
+                self._paint_edge_band(raster, edge, tolerance, top, bottom)
+        self.free_spans.update(raster, stride, top, bottom)
+    
+    def _refresh_free_runs(self, tolerance=3):
+        """Run-engine counterpart of _refresh_area_raster, reading blocked runs and edge bands.
+
+        Only rows within reach of the latest claim's bounds are rebuilt.
+        """
+        spans = self.free_spans
+        top, bottom = spans.top, spans.bottom
+        if self.last_claim_bounds is not None:
+            _, claim_top, _, claim_height = self.last_claim_bounds
+            top = max(top, claim_top - self.y - tolerance - 1)
+            bottom = min(bottom, claim_top - self.y + claim_height + tolerance)
+        if bottom < top:
+            return
+        bands = {}
+        for edge in self.boundary_edges:
+            if min(edge[1], edge[3]) - self.y - tolerance <= bottom and max(edge[1], edge[3]) - self.y + tolerance >= top:
+                for row, col_lo, col_hi in self._edge_band(edge, tolerance, top, bottom):
+                    bands.setdefault(row, []).append((col_lo, col_hi + 1))
+        for row in range(top, bottom + 1):
+            covered = sorted(self.blocked_grid.runs(row) + bands.get(row, []))
+            runs = []
+            start = spans.left
+            for lo, hi in covered:
+                if lo > start:
+                    runs.append((start, lo))
+                start = max(start, hi)
+            runs.append((start, spans.right + 1))
+            spans.set_row(row, runs)
+    
+    def _paint_edge_band(self, raster, edge, tolerance, top, bottom):
+        """Mark every raster point between rows ``top`` and ``bottom`` that is_point_on_edge would accept for this edge."""
+        stride = self.width + 1
+        for row, col_lo, col_hi in self._edge_band(edge, tolerance, top, bottom):
+            raster[row * stride + col_lo:row * stride + col_hi + 1] = bytes([AREA_EDGE]) * (col_hi - col_lo + 1)
+    
+    def _edge_band(self, edge, tolerance, top, bottom):
+        """``(row, first, last)`` column ranges of the points within ``tolerance`` of ``edge``."""
+        x1, y1, x2, y2 = (edge[0] - self.x, edge[1] - self.y, edge[2] - self.x, edge[3] - self.y)
+        top, bottom = max(0, top), min(self.height, bottom)
+        if abs(x1 - x2) < 1 or abs(y1 - y2) < 1:
+            if abs(x1 - x2) < 1:
+                col_lo, col_hi = math.floor(x1 - tolerance) + 1, math.ceil(x1 + tolerance) - 1
+                row_lo, row_hi = math.ceil(min(y1, y2)), math.floor(max(y1, y2))
+            else:
+                col_lo, col_hi = math.ceil(min(x1, x2)), math.floor(max(x1, x2))
+                row_lo, row_hi = math.floor(y1 - tolerance) + 1, math.ceil(y1 + tolerance) - 1
+            col_lo, col_hi = max(0, col_lo), min(self.width, col_hi)
+            if col_hi < col_lo:
+                return
+            for row in range(max(top, row_lo), min(bottom, row_hi) + 1):
+                yield row, col_lo, col_hi
+            return
+        
+        length = ((y2 - y1) ** 2 + (x2 - x1) ** 2) ** 0.5
+        for row in range(max(top, math.ceil(min(y1, y2))), min(bottom, math.floor(max(y1, y2))) + 1):
+            cols = [
+                col for col in range(max(0, math.ceil(min(x1, x2))), min(self.width, math.floor(max(x1, x2))) + 1)
+                if abs((y2 - y1) * col - (x2 - x1) * row + x2 * y1 - y2 * x1) / length < tolerance
+            ]
+            if cols:
+                yield row, cols[0], cols[-1]
         
     def get_boundary_edges(self):
         return self.boundary_edges
@@ -44,6 +307,14 @@ class World:
     def set_incursion_warning(self, active):
         self.incursion_warning = active
     
+    def get_incursion_color(self):
+        blink = (self.clock.get_ticks() // 150) % 2 == 0
+        return (255, 0, 0) if self.incursion_warning and blink else (255, 255, 0)
+    
+    def get_incursion_bounds(self, start=0):
+        """Screen box covering the drawn trail from vertex ``start`` onwards."""
+        return _bounds(self.current_incursion[start:], pad=2)
+    
     def _to_local_coords(self, x, y):
         lx = int(round(x - self.x))
         ly = int(round(y - self.y))
@@ -52,7 +323,7 @@ class World:
         return lx, ly
     
     def is_point_on_edge(self, x, y, tolerance=3):
-        for edge in self.boundary_edges:
+        for edge in self.edge_index.near(x, y, tolerance):
             x1, y1, x2, y2 = edge
             
             if abs(x1 - x2) < 1:
@@ -69,78 +340,142 @@ class World:
         return False
     
     def snap_to_edge(self, x, y):
-        closest_point = (x, y)
-        best_dist = float("inf")
-        for x1, y1, x2, y2 in self.boundary_edges:
-            dx = x2 - x1
-            dy = y2 - y1
-            length_sq = dx * dx + dy * dy
-            if length_sq == 0:
-                continue
-            t = ((x - x1) * dx + (y - y1) * dy) / length_sq
-            t = max(0.0, min(1.0, t))
-            proj_x = x1 + dx * t
-            proj_y = y1 + dy * t
-            dist_sq = (proj_x - x) ** 2 + (proj_y - y) ** 2
-            if dist_sq < best_dist:
-                best_dist = dist_sq
-                closest_point = (proj_x, proj_y)
-        return closest_point
+        hit = self.perimeter.project(x, y)
+        return hit[2] if hit else (x, y)
     
     def is_point_in_unclaimed_area(self, x, y):
         if not self.is_point_within_bounds(x, y):
             return False
-        
-        if self.is_point_on_edge(x, y):
-            return False
-
-        local_x, local_y = self._to_local_coords(x, y)
-        if self.blocked_grid[local_y][local_x]:
-            return False
-        return True
+        if self.use_vector:
+            return not self.is_point_on_edge(x, y) and self._point_inside_polygon((x, y), self.boundary_path)
+        col, row = int(round(x - self.x)), int(round(y - self.y))
+        if self.use_runs:
+            if self.blocked_grid.contains(min(col, self.width - 1), min(row, self.height - 1)):
+                return False
+            return not self.is_point_on_edge(self.x + col, self.y + row)
+        return self.area_raster[row * (self.width + 1) + col] == AREA_FREE
 
+    def sample_free_point(self, rng):
+        """Uniformly random unclaimed point at least FREE_SAMPLE_MARGIN inside the field, or None."""
+        if self.free_spans is None:
+            return self._sample_free_point_in_polygon(rng)
+        hit = self.free_spans.sample(rng)
+        if hit is None:
+            return None
+        column, row = hit
+        return (self.x + column, self.y + row)
+    
+    def _sample_free_point_in_polygon(self, rng, attempts=50):
+        """Vector engine: uniform over the boundary polygon inside the margin, minus the edge band."""
+        if self._polygon_sampler_version != self.boundary_version:
+            self._polygon_sampler = PolygonSampler(self.boundary_path, (
+                self.x + FREE_SAMPLE_MARGIN, self.y + FREE_SAMPLE_MARGIN,
+                self.x + self.width - FREE_SAMPLE_MARGIN, self.y + self.height - FREE_SAMPLE_MARGIN,
+            ))
+            self._polygon_sampler_version = self.boundary_version
+        for _ in range(attempts):
+            point = self._polygon_sampler.sample(rng)
+            if point is None:
+                return None
+            if self.is_point_in_unclaimed_area(*point):
+                return point
+        return None
+    
     def is_point_within_bounds(self, x, y):
         return self.x <= x <= self.x + self.width and self.y <= y <= self.y + self.height
 
     def is_point_claimed(self, x, y):
         if not self.is_point_within_bounds(x, y):
             return False
+        if self.use_vector:
+            return not self._point_inside_polygon((x, y), self.boundary_path)
         local_x, local_y = self._to_local_coords(x, y)
         return bool(self.claimed_grid[local_y][local_x])
     
     def start_incursion(self, x, y):
         snapped = self.snap_to_edge(x, y)
-        self.current_incursion = [snapped]
+        self._clear_incursion()
+        self.add_to_incursion(*snapped)
     
     def add_to_incursion(self, x, y):
-        self.current_incursion.append((x, y))
+        """Record the next step, merging it into the last segment when it runs straight on.
+
+        ``current_incursion`` only keeps the turning points; its last entry is always the tip.
+        """
+        points = self.current_incursion
+        step = self._recent_steps[-1][0] + 1 if self._recent_steps else 0
+        self._recent_steps.append((step, (x, y)))
+        
+        if len(points) >= 2 and self._continues_last_segment(x, y):
+            start_x, start_y = points[-2]
+            points[-1] = (x, y)
+            self._incursion_vertex_steps[-1] = step
+            self.incursion_index.extend_last((start_x, start_y, x, y))
+            return
+        
+        if points:
+            last_x, last_y = points[-1]
+            self.incursion_index.add((last_x, last_y, x, y))
+        points.append((x, y))
+        self._incursion_vertex_steps.append(step)
+    
+    def _continues_last_segment(self, x, y):
+        (x1, y1), (x2, y2) = self.current_incursion[-2:]
+        if x1 == x2 == x:
+            return (y2 - y1) * (y - y2) > 0
+        if y1 == y2 == y:
+            return (x2 - x1) * (x - x2) > 0
+        return False
     
     def cancel_incursion(self):
         start_pos = None
         if self.current_incursion:
             start_pos = self.current_incursion[0]
-        self.current_incursion = []
+        self._clear_incursion()
         return start_pos
     
+    def _clear_incursion(self):
+        self.current_incursion = []
+        self.incursion_index = EdgeIndex([], self.x, self.y, self.edge_cell_size)
+        # NumPy copy of the trail for check_enemy_collisions, keyed on its length and last segment.
+        self._trail_arrays = None
+        self._trail_arrays_key = None
+        # Step number of each recorded vertex, plus the last few raw steps so
+        # check_incursion_collision can still skip tail steps inside a merged segment.
+        self._incursion_vertex_steps = []
+        self._recent_steps = deque(maxlen=MAX_SKIP_TAIL_SEGMENTS + 1)
+    
     def complete_incursion(self, qix_pos=None):
         if len(self.current_incursion) < 2 or not qix_pos:
-            self.current_incursion = []
+            self._clear_incursion()
             return False
         
         end_x, end_y = self.current_incursion[-1]
         if not self.is_point_on_edge(end_x, end_y):
-            self.current_incursion = []
+            self._clear_incursion()
             return False
         
-        area_claimed = self._claim_enclosed_area(qix_pos)
-        if not area_claimed:
-            self.current_incursion = []
+        profiler = self.profiler
+        if profiler is not None:
+            start = profiler.timer()
+            claimed_before = self.claimed_area
+
+        split = self._split_boundary(qix_pos)
+        if self.use_vector:
+            claimed = split and self._claim_enclosed_polygon(qix_pos, split)
+        else:
+            claimed = split and self._claim_enclosed_area(qix_pos, split)
+        if not claimed:
+            self._clear_incursion()
             return False
 
         self._mark_incursion_path_claimed()
-        self._rebuild_boundary_from_incursion(qix_pos)
+        self._rebuild_boundary_from_incursion(split)
+        self.claim_count += 1
+        if profiler is not None:
+            profiler.record_claim(start, self.claimed_area - claimed_before, len(self.boundary_path))
         
-        self.current_incursion = []
+        self._clear_incursion()
         return True
     
     def get_claimed_percentage(self):
@@ -151,68 +486,265 @@ class World:
         return self.current_incursion
     
     def check_incursion_collision(self, x, y, threshold=10, skip_tail_segments=0):
-        if len(self.current_incursion) < 2:
-            return False
-
-        segment_limit = len(self.current_incursion) - 1 - max(0, skip_tail_segments)
-        if segment_limit <= 0:
-            return False
+        threshold_squared = threshold ** 2
+        for x1, y1, x2, y2 in self._trail_edges_near(x, y, threshold, skip_tail_segments):
+            if _point_segment_distance_squared(x, y, x1, y1, x2, y2) < threshold_squared:
+                return True
+        return False
+    
+    def check_swept_incursion_collision(self, start, end, threshold=10, skip_tail_segments=0):
+        """check_incursion_collision for a circle moving in a straight line from ``start`` to ``end``.
 
-        for i in range(segment_limit):
-            x1, y1 = self.current_incursion[i]
-            x2, y2 = self.current_incursion[i + 1]
-            
-            line_length = ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
-            if line_length < 0.1:
-                continue
-            
-            dot = ((x - x1) * (x2 - x1) + (y - y1) * (y2 - y1)) / (line_length ** 2)
-            dot = max(0, min(1, dot))
-            
-            closest_x = x1 + dot * (x2 - x1)
-            closest_y = y1 + dot * (y2 - y1)
-            
-            distance = ((x - closest_x) ** 2 + (y - closest_y) ** 2) ** 0.5
-            if distance < threshold:
+        Catches trail contact anywhere along the move, so fast movers cannot step over the trail.
+        """
+        (x0, y0), (x1, y1) = start, end
+        # A box around the midpoint that holds the whole swept circle.
+        reach = threshold + max(abs(x1 - x0), abs(y1 - y0)) / 2
+        threshold_squared = threshold ** 2
+        for cx, cy, dx, dy in self._trail_edges_near((x0 + x1) / 2, (y0 + y1) / 2, reach, skip_tail_segments):
+            if _segments_distance_squared(x0, y0, x1, y1, cx, cy, dx, dy) < threshold_squared:
                 return True
-        
         return False
     
-    def _claim_enclosed_area(self, qix_pos):
-        blocked = [bytearray(row) for row in self.claimed_grid]
+    def check_swept_collision(self, start, end, other_start, other_end, threshold=10):
+        """Whether two circles moving in straight lines over the same tick come within ``threshold``."""
+        # In the frame of the other mover the first one travels the segment from rel_start to rel_end.
+        rel_start_x = start[0] - other_start[0]
+        rel_start_y = start[1] - other_start[1]
+        rel_end_x = end[0] - other_end[0]
+        rel_end_y = end[1] - other_end[1]
+        return _point_segment_distance_squared(0, 0, rel_start_x, rel_start_y, rel_end_x, rel_end_y) < threshold ** 2
+    
+    def check_enemy_collisions(self, positions, thresholds, player_pos=None, previous_positions=None,
+                               previous_player_pos=None):
+        """Test all enemy positions against the player and the whole trail at once.
+
+        ``thresholds`` is one contact distance, or one per position. Returns ``(index, target)``
+        pairs in enemy order, target being ``"player"`` or ``"trail"``; an enemy touching both
+        is reported once, as hitting the player. Given ``previous_positions`` (and optionally
+        ``previous_player_pos``) the tests are swept over the tick's straight-line moves.
+        """
+        count = len(positions)
+        if not count:
+            return []
+        trail = self.incursion_index.edges if len(self.current_incursion) >= 2 else []
+        swept = previous_positions is not None
+        if swept and previous_player_pos is None:
+            previous_player_pos = player_pos
+        if np is None or count < BATCH_COLLISION_MIN_ENEMIES:
+            return self._enemy_collisions_python(
+                positions, thresholds, player_pos, trail, previous_positions, previous_player_pos
+            )
         
-        for x1, y1, x2, y2 in self.boundary_edges:
-            lx1, ly1 = self._to_local_coords(x1, y1)
-            lx2, ly2 = self._to_local_coords(x2, y2)
-            self._mark_line_on_grid(blocked, lx1, ly1, lx2, ly2)
+        points = np.asarray(positions, dtype=float).reshape(count, 2)
+        xs = points[:, 0]
+        ys = points[:, 1]
+        start_xs, start_ys = xs, ys
+        if swept:
+            previous = np.asarray(previous_positions, dtype=float).reshape(count, 2)
+            start_xs = previous[:, 0]
+            start_ys = previous[:, 1]
+        limits = np.broadcast_to(np.asarray(thresholds, dtype=float) ** 2, (count,))
+        hits_player = np.zeros(count, dtype=bool)
+        if player_pos is not None and swept:
+            # Relative to the player each enemy moves from rel_start to rel_end; test that segment against 0.
+            rel_x = start_xs - previous_player_pos[0]
+            rel_y = start_ys - previous_player_pos[1]
+            rel_dx = xs - player_pos[0] - rel_x
+            rel_dy = ys - player_pos[1] - rel_y
+            hits_player = _np_point_segment_distance_squared(
+                0.0, 0.0, rel_x, rel_y, rel_dx, rel_dy, rel_dx ** 2 + rel_dy ** 2
+            ) < limits
+        elif player_pos is not None:
+            hits_player = (xs - player_pos[0]) ** 2 + (ys - player_pos[1]) ** 2 < limits
         
-        for i in range(len(self.current_incursion) - 1):
-            x1, y1 = self.current_incursion[i]
-            x2, y2 = self.current_incursion[i + 1]
-            lx1, ly1 = self._to_local_coords(x1, y1)
-            lx2, ly2 = self._to_local_coords(x2, y2)
-            self._mark_line_on_grid(blocked, lx1, ly1, lx2, ly2)
+        hits_trail = np.zeros(count, dtype=bool)
+        segments = self._trail_segment_arrays(trail)
+        if segments is not None:
+            x1, y1, dx, dy, length_squared, (left, top, right, bottom) = segments
+            # Only enemies whose move stays near the trail's box pay for the segment test.
+            reach = np.sqrt(limits)
+            near = (
+                (np.maximum(xs, start_xs) > left - reach) & (np.minimum(xs, start_xs) < right + reach)
+                & (np.maximum(ys, start_ys) > top - reach) & (np.minimum(ys, start_ys) < bottom + reach)
+            )
+            candidates = np.flatnonzero(near & ~hits_player)
+            if len(candidates):
+                px = xs[candidates, None]
+                py = ys[candidates, None]
+                if swept:
+                    sx = start_xs[candidates, None]
+                    sy = start_ys[candidates, None]
+                    squared = _np_segments_distance_squared(
+                        sx, sy, px - sx, py - sy, (px - sx) ** 2 + (py - sy) ** 2, x1, y1, dx, dy, length_squared
+                    )
+                else:
+                    squared = _np_point_segment_distance_squared(px, py, x1, y1, dx, dy, length_squared)
+                hits_trail[candidates] = (squared < limits[candidates, None]).any(axis=1)
+        
+        return [
+            (index, "player" if hits_player[index] else "trail")
+            for index in np.flatnonzero(hits_player | hits_trail).tolist()
+        ]
+    
+    def _trail_segment_arrays(self, trail):
+        """Trail segments as NumPy columns plus their bounding box, rebuilt only when the trail changes."""
+        if not trail:
+            return None
+        # Between clears the trail only grows or stretches its last segment.
+        key = (len(trail), trail[-1])
+        if self._trail_arrays_key != key:
+            segments = np.asarray(trail, dtype=float)
+            dx = segments[:, 2] - segments[:, 0]
+            dy = segments[:, 3] - segments[:, 1]
+            length_squared = dx ** 2 + dy ** 2
+            keep = length_squared >= MIN_SEGMENT_LENGTH_SQUARED
+            segments = segments[keep]
+            self._trail_arrays = None
+            if len(segments):
+                bounds = (
+                    segments[:, 0::2].min(), segments[:, 1::2].min(),
+                    segments[:, 0::2].max(), segments[:, 1::2].max(),
+                )
+                self._trail_arrays = (
+                    segments[:, 0], segments[:, 1], dx[keep], dy[keep], length_squared[keep], bounds,
+                )
+            self._trail_arrays_key = key
+        return self._trail_arrays
+    
+    def _enemy_collisions_python(self, positions, thresholds, player_pos, trail, previous_positions,
+                                 previous_player_pos):
+        if not isinstance(thresholds, (list, tuple)):
+            thresholds = [thresholds] * len(positions)
+        hits = []
+        for index, (position, threshold) in enumerate(zip(positions, thresholds)):
+            x, y = position
+            if previous_positions is None:
+                if player_pos is not None and (x - player_pos[0]) ** 2 + (y - player_pos[1]) ** 2 < threshold ** 2:
+                    hits.append((index, "player"))
+                elif trail and self.check_incursion_collision(x, y, threshold):
+                    hits.append((index, "trail"))
+                continue
+            start = previous_positions[index]
+            if player_pos is not None and \
+                    self.check_swept_collision(start, position, previous_player_pos, player_pos, threshold):
+                hits.append((index, "player"))
+            elif trail and self.check_swept_incursion_collision(start, position, threshold):
+                hits.append((index, "trail"))
+        return hits
+    
+    def _trail_edges_near(self, x, y, radius, skip_tail_segments):
+        """Trail segments near ``(x, y)``, minus the last ``skip_tail_segments`` recorded steps."""
+        if skip_tail_segments > MAX_SKIP_TAIL_SEGMENTS:
+            raise ValueError(f"skip_tail_segments is at most {MAX_SKIP_TAIL_SEGMENTS}")
+        if len(self.current_incursion) < 2:
+            return
+
+        # skip_tail_segments counts recorded steps, which may sit inside the last merged segment.
+        cut_step = self._incursion_vertex_steps[-1] - max(0, skip_tail_segments)
+        if cut_step <= 0:
+            return
+        cut_vertex = bisect.bisect_right(self._incursion_vertex_steps, cut_step) - 1
+        cut_point = None
+        if self._incursion_vertex_steps[cut_vertex] < cut_step:
+            cut_point = self._step_point(cut_step)
+
+        for i in self.incursion_index.near_indices(x, y, radius):
+            if i > cut_vertex or (i == cut_vertex and cut_point is None):
+                break
+            x1, y1, x2, y2 = self.incursion_index.edges[i]
+            if i == cut_vertex:
+                x2, y2 = cut_point
+            if (x2 - x1) ** 2 + (y2 - y1) ** 2 >= MIN_SEGMENT_LENGTH_SQUARED:
+                yield x1, y1, x2, y2
+    
+    def _step_point(self, step):
+        for recorded_step, point in self._recent_steps:
+            if recorded_step >= step:
+                return point
+        return self.current_incursion[-1]
+    
+    def _claim_enclosed_area(self, qix_pos, split):
+        """Fill the side of the incursion away from the Qix against the cached wall grid."""
+        claim_left = split[2]
+        walls = self.wall_grid
+        added = []
+        seeds = []
+        incursion_cells = set()
+        points = [self._to_local_coords(x, y) for x, y in self.current_incursion]
+        for (x1, y1), (x2, y2) in zip(points, points[1:]):
+            cells = self._line_cells(x1, y1, x2, y2)
+            incursion_cells.update(cells)
+            for x, y in cells:
+                if self.use_runs:
+                    if walls.add(y, x, x + 1):
+                        added.append((x, y))
+                elif not walls[y][x]:
+                    walls[y][x] = 1
+                    added.append((x, y))
+            dx = (x2 > x1) - (x2 < x1)
+            dy = (y2 > y1) - (y2 < y1)
+            nx, ny = (-dy, dx) if claim_left else (dy, -dx)
+            for x, y in cells[1:-1]:
+                if nx:
+                    seeds.append((x + nx, y))
+                if ny:
+                    seeds.append((x, y + ny))
         
         qx, qy = self._to_local_coords(*qix_pos)
-        if blocked[qy][qx]:
-            return False
+        spans = []
+        flood_fill = self._flood_fill_runs if self.use_runs else self._flood_fill
+        enclosed = not walls[qy][qx]
+        if enclosed:
+            for x, y in seeds:
+                if 0 <= x < self.width and 0 <= y < self.height and not walls[y][x]:
+                    if not flood_fill(walls, x, y, spans, avoid=(qx, qy)):
+                        enclosed = False
+                        break
         
-        visited = self._flood_fill(blocked, qx, qy)
-        new_cells = []
-        for y in range(self.height):
-            blocked_row = blocked[y]
-            visited_row = visited[y]
-            for x in range(self.width):
-                if not blocked_row[x] and not visited_row[x]:
-                    new_cells.append((x, y))
+        if not enclosed or not spans:
+            for y, start, end in spans:
+                if self.use_runs:
+                    walls.remove(y, start, end)
+                else:
+                    walls[y][start:end] = bytes(end - start)
+            for x, y in added:
+                if self.use_runs:
+                    walls.remove(y, x, x + 1)
+                else:
+                    walls[y][x] = 0
+            return False
         
-        if not new_cells:
+        self._released_arc_spans = self._release_pending_arc(incursion_cells)
+        self._fill_claimed_spans(spans + self._released_arc_spans)
+        return True
+    
+    def _claim_enclosed_polygon(self, qix_pos, split):
+        """Vector-mode claim: the Qix must lie in the kept polygon and not the enclosed one.
+
+        Only claim_surface is painted; claimed_area follows from the new boundary polygon.
+        """
+        new_path, enclosed_arc, _ = split
+        if not self._point_inside_polygon(qix_pos, new_path):
             return False
         
-        self._fill_claimed_cells(new_cells)
+        # The enclosed arc runs from one incursion end back to the other; the incursion closes it.
+        incursion = self.current_incursion
+        if enclosed_arc and enclosed_arc[0] == incursion[-1]:
+            closing = incursion[1:]
+        else:
+            closing = incursion[::-1][1:]
+        enclosed = list(enclosed_arc) + closing
+        if self._point_inside_polygon(qix_pos, enclosed):
+            return False
+        if self.claim_surface is not None and len(enclosed) >= 3:
+            import pygame
+            local = [(px - self.x, py - self.y) for px, py in enclosed]
+            pygame.draw.polygon(self.claim_surface, (100, 100, 150), local)
         return True
     
-    def _mark_line_on_grid(self, grid, x1, y1, x2, y2):
+    def _line_cells(self, x1, y1, x2, y2):
+        cells = []
         dx = abs(x2 - x1)
         dy = -abs(y2 - y1)
         sx = 1 if x1 < x2 else -1
@@ -222,7 +754,7 @@ class World:
         
         while True:
             if 0 <= x < self.width and 0 <= y < self.height:
-                grid[y][x] = 1
+                cells.append((x, y))
             if x == x2 and y == y2:
                 break
             e2 = 2 * err
@@ -232,52 +764,93 @@ class World:
             if e2 <= dx:
                 err += dx
                 y += sy
+        return cells
     
-    def _flood_fill(self, blocked, start_x, start_y):
-        visited = [bytearray(self.width) for _ in range(self.height)]
-        queue = deque()
-        
-        queue.append((start_x, start_y))
-        visited[start_y][start_x] = 1
-        
-        while queue:
-            x, y = queue.popleft()
-            for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-                nx = x + dx
-                ny = y + dy
-                if 0 <= nx < self.width and 0 <= ny < self.height:
-                    if not blocked[ny][nx] and not visited[ny][nx]:
-                        visited[ny][nx] = 1
-                        queue.append((nx, ny))
-        return visited
-    
-    def _fill_claimed_cells(self, cells):
-        rows = {}
-        for x, y in cells:
-            if self.claimed_grid[y][x]:
+    def _polyline_cells(self, points):
+        cells = []
+        local = [self._to_local_coords(x, y) for x, y in points]
+        for (x1, y1), (x2, y2) in zip(local, local[1:]):
+            cells.extend(self._line_cells(x1, y1, x2, y2))
+        return cells
+    
+    def _flood_fill(self, grid, start_x, start_y, spans, avoid=None):
+        """Scanline fill from the start cell, marking reached cells in ``grid``.
+
+        Filled ``(y, start, end)`` spans (end exclusive) are appended to ``spans``.
+        Returns False as soon as the fill reaches the ``avoid`` cell.
+        """
+        stack = [(start_x, start_y)]
+        while stack:
+            x, y = stack.pop()
+            row = grid[y]
+            if row[x]:
                 continue
-            rows.setdefault(y, []).append(x)
-        
-        if not rows:
-            return
-        
+            left = row.rfind(1, 0, x) + 1
+            right = row.find(1, x)
+            if right == -1:
+                right = self.width
+            row[left:right] = b"\x01" * (right - left)
+            spans.append((y, left, right))
+            if avoid and avoid[1] == y and left <= avoid[0] < right:
+                return False
+            
+            for ny in (y - 1, y + 1):
+                if not 0 <= ny < self.height:
+                    continue
+                neighbour = grid[ny]
+                nx = neighbour.find(0, left, right)
+                while nx != -1:
+                    stack.append((nx, ny))
+                    nx = neighbour.find(1, nx, right)
+                    if nx == -1:
+                        break
+                    nx = neighbour.find(0, nx, right)
+        return True
+    
+    def _flood_fill_runs(self, grid, start_x, start_y, spans, avoid=None):
+        """_flood_fill over a RunGrid: each reached gap is set with one add."""
+        stack = [(start_x, start_y)]
+        while stack:
+            x, y = stack.pop()
+            gap = grid.gap(y, x)
+            if gap is None:
+                continue
+            left, right = gap
+            grid.add(y, left, right)
+            spans.append((y, left, right))
+            if avoid and avoid[1] == y and left <= avoid[0] < right:
+                return False
+            
+            for ny in (y - 1, y + 1):
+                if 0 <= ny < self.height:
+                    stack.extend((start, ny) for start, _ in grid.gaps(ny, left, right))
+        return True
+    
+    def _fill_claimed_spans(self, spans):
         color = (100, 100, 150)
-        for y, xs in rows.items():
-            xs.sort()
-            self.claimed_area += len(xs)
-            for x in xs:
-                self.claimed_grid[y][x] = 1
-            start = xs[0]
-            prev = xs[0]
-            for x in xs[1:]:
-                if x == prev + 1:
-                    prev = x
-                else:
-                    self._draw_claim_rect(color, start, y, prev - start + 1, 1)
-                    start = x
-                    prev = x
-            self._draw_claim_rect(color, start, y, prev - start + 1, 1)
-
+        if self.use_runs:
+            for y, start, end in spans:
+                self.claimed_area += self.claimed_grid.add(y, start, end)
+            for x, y, width, height in self._span_rects(spans):
+                self._draw_claim_rect(color, x, y, width, height)
+            return
+        for y, start, end in spans:
+            self.claimed_grid[y][start:end] = b"\x01" * (end - start)
+            self.claimed_area += end - start
+            self._draw_claim_rect(color, start, y, end - start, 1)
+    
+    def _span_rects(self, spans):
+        """Stack spans with the same extent on consecutive rows into ``(x, y, width, height)`` rects."""
+        rects = []
+        for y, start, end in sorted(spans, key=lambda span: (span[1], span[2], span[0])):
+            if rects:
+                x, top, width, height = rects[-1]
+                if x == start and width == end - start and top + height == y:
+                    rects[-1] = (x, top, width, height + 1)
+                    continue
+            rects.append((start, y, end - start, 1))
+        return rects
+    
     def _mark_incursion_path_claimed(self):
         if len(self.current_incursion) < 2:
             return
@@ -296,12 +869,17 @@ class World:
         pad_y2 = min(self.height, y + height + padding)
         rect_width = max(1, pad_x2 - pad_x1)
         rect_height = max(1, pad_y2 - pad_y1)
-        pygame.draw.rect(self.claim_surface, color, (pad_x1, pad_y1, rect_width, rect_height))
+        if self.claim_surface is not None:
+            import pygame
+            pygame.draw.rect(self.claim_surface, color, (pad_x1, pad_y1, rect_width, rect_height))
         self._mark_block_rect(pad_x1, pad_y1, pad_x2 - 1, pad_y2 - 1)
 
     def _draw_claim_line(self, color, x1, y1, x2, y2, padding=1):
-        pygame.draw.line(self.claim_surface, color, (x1, y1), (x2, y2), width=padding * 2 + 1)
-        self._block_line(x1, y1, x2, y2, padding)
+        if self.claim_surface is not None:
+            import pygame
+            pygame.draw.line(self.claim_surface, color, (x1, y1), (x2, y2), width=padding * 2 + 1)
+        if not self.use_vector:
+            self._block_line(x1, y1, x2, y2, padding)
 
     def _block_line(self, x1, y1, x2, y2, padding=1):
         dx = abs(x2 - x1)
@@ -310,8 +888,15 @@ class World:
         sy = 1 if y1 < y2 else -1
         err = dx + dy
         x, y = x1, y1
+        # The run engine collects each row's covered extent and sets it with one add per row.
+        extents = {} if self.use_runs else None
         while True:
-            self._mark_block_point(x, y, padding)
+            if extents is None:
+                self._mark_block_point(x, y, padding)
+            else:
+                for py in range(y - padding, y + padding + 1):
+                    lo, hi = extents.get(py, (x, x))
+                    extents[py] = (min(lo, x), max(hi, x))
             if x == x2 and y == y2:
                 break
             e2 = 2 * err
@@ -321,6 +906,10 @@ class World:
             if e2 <= dx:
                 err += dx
                 y += sy
+        if extents:
+            for py, (lo, hi) in extents.items():
+                if 0 <= py < self.height:
+                    self.blocked_grid.add(py, lo - padding, hi + padding + 1)
 
     def _mark_block_rect(self, x1, y1, x2, y2):
         x1 = max(0, min(self.width - 1, int(x1)))
@@ -329,12 +918,17 @@ class World:
         y2 = max(0, min(self.height - 1, int(y2)))
         if x2 < x1 or y2 < y1:
             return
+        if self.use_runs:
+            self.blocked_grid.add_rect(x1, y1, x2, y2)
+            return
+        fill = b"\x01" * (x2 - x1 + 1)
         for y in range(y1, y2 + 1):
-            row = self.blocked_grid[y]
-            for x in range(x1, x2 + 1):
-                row[x] = 1
+            self.blocked_grid[y][x1:x2 + 1] = fill
 
     def _mark_block_point(self, x, y, padding=0):
+        if self.use_runs:
+            self.blocked_grid.add_rect(x - padding, y - padding, x + padding, y + padding)
+            return
         for py in range(y - padding, y + padding + 1):
             if 0 <= py < self.height:
                 row = self.blocked_grid[py]
@@ -342,26 +936,31 @@ class World:
                     if 0 <= px < self.width:
                         row[px] = 1
     
-    def _rebuild_boundary_from_incursion(self, qix_pos):
-        if not self.current_incursion:
-            return
+    def _split_boundary(self, qix_pos):
+        """Split the boundary at the incursion.
+
+        Returns ``(new_path, enclosed_arc, claim_left)``: the polygon kept around the Qix,
+        the boundary arc cut off by the incursion, and whether the enclosed side lies to the
+        left of the incursion's direction of travel.
+        """
+        if len(self.current_incursion) < 2:
+            return None
         
         start_point = self.current_incursion[0]
         end_point = self.current_incursion[-1]
         
-        self._ensure_boundary_point(start_point)
-        self._ensure_boundary_point(end_point)
-        
-        start_idx = self._find_point_index(start_point)
-        end_idx = self._find_point_index(end_point)
-        if start_idx == -1 or end_idx == -1 or len(self.boundary_path) < 2:
-            return
+        # The endpoints go into a copy, so boundary_path only changes once the claim succeeds.
+        path = list(self.boundary_path)
+        self._ensure_boundary_point(path, start_point)
+        self._ensure_boundary_point(path, end_point)
         
-        arc1 = self._build_arc(start_idx, end_idx)
-        arc2 = self._build_arc(end_idx, start_idx)
+        start_idx = self._find_point_index(path, start_point)
+        end_idx = self._find_point_index(path, end_point)
+        if start_idx == -1 or end_idx == -1 or len(path) < 2:
+            return None
         
-        if len(self.current_incursion) < 2:
-            return
+        arc1 = self._build_arc(path, start_idx, end_idx)
+        arc2 = self._build_arc(path, end_idx, start_idx)
         
         forward_inc = self.current_incursion[1:]
         reverse_inc = list(reversed(self.current_incursion))[1:]
@@ -369,34 +968,69 @@ class World:
         poly1 = arc1 + reverse_inc
         poly2 = arc2 + forward_inc
         
-        if not poly1 or not poly2:
-            return
-        
+        # Both halves keep the boundary's winding; only poly2 runs the incursion forwards.
+        counter_clockwise = self._signed_area(path) > 0
         if self._point_inside_polygon(qix_pos, poly1):
-            new_path = poly1
-        else:
-            new_path = poly2
-        
+            return poly1, arc2, counter_clockwise
+        return poly2, arc1, not counter_clockwise
+    
+    def _rebuild_boundary_from_incursion(self, split):
+        new_path, enclosed_arc, _ = split
+        released = [
+            (self.x + x, self.y + y) for y, start, end in self._released_arc_spans for x in (start, end - 1)
+        ]
+        self.last_claim_bounds = _bounds(self.current_incursion + list(enclosed_arc) + released, pad=2)
+        self._released_arc_spans = []
+        if not self.use_vector:
+            self._defer_enclosed_arc(enclosed_arc)
         self.boundary_path = self._simplify_path(new_path)
         self._update_boundary_edges()
     
-    def _ensure_boundary_point(self, point):
-        idx = self._find_point_index(point)
+    def _defer_enclosed_arc(self, arc):
+        """Queue the old boundary cells sealed inside the claim; they stay walls until the next claim."""
+        incursion_cells = set(self._polyline_cells(self.current_incursion))
+        for x, y in self._polyline_cells(arc):
+            if (x, y) not in incursion_cells and not self.claimed_grid[y][x]:
+                self._pending_arc_cells.add((y, x))
+    
+    def _release_pending_arc(self, incursion_cells):
+        """Row spans of the queued arc cells this claim picks up, skipping any its incursion retraces."""
+        spans = []
+        for y, x in sorted(self._pending_arc_cells):
+            if (x, y) in incursion_cells or self.claimed_grid[y][x]:
+                continue
+            if spans and spans[-1][0] == y and spans[-1][2] == x:
+                spans[-1] = (y, spans[-1][1], x + 1)
+            else:
+                spans.append((y, x, x + 1))
+        self._pending_arc_cells.clear()
+        return spans
+    
+    def _signed_area(self, polygon):
+        area = 0.0
+        for i in range(len(polygon)):
+            x1, y1 = polygon[i - 1]
+            x2, y2 = polygon[i]
+            area += x1 * y2 - x2 * y1
+        return area / 2
+    
+    def _ensure_boundary_point(self, path, point):
+        idx = self._find_point_index(path, point)
         if idx != -1:
             return idx
         px, py = point
-        for i in range(len(self.boundary_path)):
-            x1, y1 = self.boundary_path[i]
-            x2, y2 = self.boundary_path[(i + 1) % len(self.boundary_path)]
+        for i in range(len(path)):
+            x1, y1 = path[i]
+            x2, y2 = path[(i + 1) % len(path)]
             if self._is_point_on_segment(px, py, x1, y1, x2, y2):
                 insert_idx = i + 1
-                self.boundary_path.insert(insert_idx, point)
+                path.insert(insert_idx, point)
                 return insert_idx
         return -1
     
-    def _find_point_index(self, point):
+    def _find_point_index(self, path, point):
         px, py = point
-        for idx, (x, y) in enumerate(self.boundary_path):
+        for idx, (x, y) in enumerate(path):
             if abs(x - px) < 0.1 and abs(y - py) < 0.1:
                 return idx
         return -1
@@ -411,14 +1045,14 @@ class World:
             return dot <= tolerance
         return False
     
-    def _build_arc(self, start_idx, end_idx):
+    def _build_arc(self, path, start_idx, end_idx):
         arc = []
         idx = start_idx
         while True:
-            arc.append(self.boundary_path[idx])
+            arc.append(path[idx])
             if idx == end_idx:
                 break
-            idx = (idx + 1) % len(self.boundary_path)
+            idx = (idx + 1) % len(path)
         return arc
     
     def _point_inside_polygon(self, point, polygon):
@@ -447,16 +1081,27 @@ class World:
             simplified.pop()
         return simplified
     
-    def draw(self, screen):
-        pygame.draw.rect(screen, (0, 0, 0), (self.x, self.y, self.width, self.height))
+    def _static_layer(self):
+        import pygame
+        if self._static_version == self.boundary_version:
+            return self.static_surface
         
-        screen.blit(self.claim_surface, (self.x, self.y))
-        
-        for edge in self.boundary_edges:
-            x1, y1, x2, y2 = edge
-            pygame.draw.line(screen, (0, 255, 0), (x1, y1), (x2, y2), 2)
+        # Two spare pixels: 2px boundary lines spill right of and below the field.
+        if self.static_surface is None:
+            self.static_surface = pygame.Surface((self.width + 2, self.height + 2))
+            self.static_surface.set_colorkey(STATIC_COLORKEY)
+        surface = self.static_surface
+        surface.fill(STATIC_COLORKEY)
+        surface.fill((0, 0, 0), (0, 0, self.width, self.height))
+        surface.blit(self.claim_surface, (0, 0))
+        for x1, y1, x2, y2 in self.boundary_edges:
+            pygame.draw.line(surface, (0, 255, 0), (x1 - self.x, y1 - self.y), (x2 - self.x, y2 - self.y), 2)
+        self._static_version = self.boundary_version
+        return surface
+    
+    def draw(self, screen):
+        import pygame
+        screen.blit(self._static_layer(), (self.x, self.y))
         
         if len(self.current_incursion) > 1:
-            blink = (pygame.time.get_ticks() // 150) % 2 == 0
-            color = (255, 0, 0) if self.incursion_warning and blink else (255, 255, 0)
-            pygame.draw.lines(screen, color, False, self.current_incursion, 2)
+            pygame.draw.lines(screen, self.get_incursion_color(), False, self.current_incursion, 2)
@@ -69,9 +69,16 @@ import random
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
 FIELD_MARGIN = 50
+# Game logic runs at SIMULATION_HZ fixed steps whatever the frame rate; drawing is capped at MAX_FPS.
+SIMULATION_HZ = 60
+MAX_FPS = 144
+# Steps run per frame at most; a slower machine drops game time instead of falling further behind.
+MAX_STEPS_PER_FRAME = 5
+# Moves longer than this between two steps (respawns, Sparcs re-seated after a claim) are drawn without easing.
+INTERPOLATION_MAX_JUMP = 20
 
 class Game:
-    def __init__(self):
+    def __init__(self, profile_path=None, simulation_hz=SIMULATION_HZ, max_fps=MAX_FPS):
         pygame.init()
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("Qix Game")
@@ -80,46 +87,57 @@ class Game:
         self.small_font = pygame.font.Font(None, 24)
         self.level = 1
         self.game_state = "START"
+        self.simulation = None
         self.world = None
         self.player = None
         self.qix = None
         self.sparcs = []
         self.target_percentage = 12.5
+        self.push_requested = False
+        self.step_ms = 1000 / simulation_hz
+        self.max_fps = max_fps
+        # Unsimulated time carried between frames, and how far into the next step the drawn frame sits.
+        self._accumulator = 0.0
+        self._render_alpha = 1.0
+        # Entity positions before the latest step, and the eased positions the current frame draws.
+        self._previous_positions = {}
+        self._render_positions = {}
+        # With a trace path, frames are profiled, shown in an overlay and dumped there on exit.
+        self.profile_path = profile_path
+        self.profiler = FrameProfiler() if profile_path else None
+        # Rendered HUD text by slot and dimming overlays by alpha, so steady frames skip font work.
+        self._text_cache = {}
+        self._overlay_cache = {}
+        self._reset_dirty_tracking()
+    
+    def _reset_dirty_tracking(self):
+        # What the screen currently shows, so draw() can repaint only the difference.
+        self._drawn_state = None
+        self._sprite_rects = {}
+        self._trail_rect = None
+        self._drawn_trail_length = 0
+        self._drawn_trail_color = None
+        self._drawn_boundary_version = None
+        self._drawn_hud = None
         
     def _init_level(self):
         field_width = WINDOW_WIDTH - 2 * FIELD_MARGIN
         field_height = WINDOW_HEIGHT - 2 * FIELD_MARGIN - 50
         
-        self.world = World(FIELD_MARGIN, FIELD_MARGIN, field_width, field_height)
-        
-        start_x = FIELD_MARGIN
-        start_y = FIELD_MARGIN
-        self.player = Player(start_x, start_y, self.world)
-        
-        center_x = FIELD_MARGIN + field_width * 3 // 4
-        center_y = FIELD_MARGIN + field_height * 3 // 4
-        self.qix = Qix(center_x, center_y, self.world)
-        
-        num_sparcs = 1 if self.level <= 2 else 2
-        self.sparcs = []
-        right_edge_x = FIELD_MARGIN + field_width
-        bottom_edge_y = FIELD_MARGIN + field_height
-        vertical_spacing = max(1, field_height // (num_sparcs + 1))
-        for i in range(num_sparcs):
-            sparc_y = bottom_edge_y - i * vertical_spacing
-            direction = 1 if i == 0 else -1
-            self.sparcs.append(Sparc(right_edge_x, sparc_y, self.world, direction=direction))
-        
-        self.target_percentage = min(12.5 * self.level, 62.5)
-        qix_base_speed = 1.5
-        qix_increment = 0.25
-        self.qix.speed = qix_base_speed + (self.level - 1) * qix_increment
-        self.qix.reset_motion()
-        
-        sparc_base_speed = 1.4
-        sparc_increment = 0.15
-        for sparc in self.sparcs:
-            sparc.speed = sparc_base_speed + (self.level - 1) * sparc_increment
+        self.simulation = Simulation(
+            self.level, FIELD_MARGIN, FIELD_MARGIN, field_width, field_height, clock=TickClock(self.step_ms),
+            profiler=self.profiler,
+        )
+        self.world = self.simulation.world
+        self.player = self.simulation.player
+        self.qix = self.simulation.qix
+        self.sparcs = self.simulation.sparcs
+        self.target_percentage = self.simulation.target_percentage
+        self.push_requested = False
+        self._accumulator = 0.0
+        self._render_alpha = 1.0
+        self._previous_positions = {}
+        self._reset_dirty_tracking()
     
     def handle_events(self):
         for event in pygame.event.get():
@@ -144,7 +162,7 @@ class Game:
                         self._init_level()
                         self.game_state = "PLAYING"
                 elif event.key == pygame.K_SPACE and self.game_state == "PLAYING":
-                    self.player.start_push()
+                    self.push_requested = True
                 elif event.key == pygame.K_ESCAPE and self.game_state in {"LEVEL_COMPLETE", "GAME_OVER", "PAUSED"}:
                     return False
         return True
@@ -153,6 +171,47 @@ class Game:
         if self.game_state != "PLAYING" or not self.world:
             return
         
+        command = self._read_command()
+        self._previous_positions = self._entity_positions()
+        self.game_state = self.simulation.step(command)
+    
+    def advance(self, elapsed_ms):
+        """Run the fixed steps that ``elapsed_ms`` of wall time covers and set the draw interpolation."""
+        if self.game_state != "PLAYING" or not self.world:
+            self._accumulator = 0.0
+            return
+        
+        self._accumulator += elapsed_ms
+        steps = 0
+        while self._accumulator >= self.step_ms and self.game_state == "PLAYING":
+            self.update()
+            self._accumulator -= self.step_ms
+            steps += 1
+            if steps == MAX_STEPS_PER_FRAME:
+                self._accumulator = min(self._accumulator, self.step_ms)
+                break
+        self._render_alpha = min(1.0, self._accumulator / self.step_ms)
+    
+    def _entity_positions(self):
+        positions = {"player": self.player.get_position(), "qix": self.qix.get_position()}
+        for i, sparc in enumerate(self.sparcs):
+            positions[("sparc", i)] = sparc.get_position()
+        return positions
+    
+    def _interpolate_positions(self):
+        """Where to draw each entity: between its last two step positions, by the render alpha."""
+        alpha = self._render_alpha
+        positions = self._entity_positions()
+        for key, (x, y) in positions.items():
+            previous = self._previous_positions.get(key)
+            if previous is None:
+                continue
+            x0, y0 = previous
+            if abs(x - x0) + abs(y - y0) <= INTERPOLATION_MAX_JUMP:
+                positions[key] = (x0 + (x - x0) * alpha, y0 + (y - y0) * alpha)
+        return positions
+    
+    def _read_command(self):
         keys = pygame.key.get_pressed()
         dx = 0
         dy = 0
@@ -168,161 +227,228 @@ class Game:
             elif keys[pygame.K_DOWN]:
                 dy = 1
         
-        if dx != 0 or dy != 0:
-            qix_pos = self.qix.get_position()
-            self.player.move(dx, dy, qix_pos)
+        push = self.push_requested
+        self.push_requested = False
+        return Command(dx, dy, push)
+    
+    def draw(self):
+        """Repaint and push only what changed since the last frame; state changes repaint everything."""
+        if self.game_state == self._drawn_state and self.game_state != "PLAYING":
+            return
         
-        self.qix.update()
-        for sparc in self.sparcs:
-            sparc.update()
+        full_redraw = self.game_state != self._drawn_state or not self.world
+        self._drawn_state = self.game_state
+        if self.world:
+            self._render_positions = self._interpolate_positions()
+        dirty = self._collect_dirty_rects() if self.world else []
+        if full_redraw:
+            self._draw_scene()
+            pygame.display.flip()
+            return
+        if not dirty:
+            return
         
-        player_x, player_y = self.player.get_position()
+        dirty = self._merge_rects(dirty)
+        for rect in dirty:
+            # pygame clips thick lines by their centre line; one spare pixel keeps the pushed rect exact.
+            self.screen.set_clip(rect.inflate(2, 2))
+            self._draw_scene()
+        self.screen.set_clip(None)
+        pygame.display.update(dirty)
+    
+    @staticmethod
+    def _merge_rects(rects):
+        """Union rects until no two lie within two pixels of each other, so their clips don't overlap."""
+        merged = []
+        for rect in rects:
+            rect = pygame.Rect(rect)
+            index = rect.inflate(4, 4).collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.inflate(4, 4).collidelist(merged)
+            merged.append(rect)
+        return merged
+    
+    def _collect_dirty_rects(self):
+        """Old and new boxes of everything that moved or changed since the previous call."""
+        dirty = []
         
-        if self.player.is_pushing:
-            qix_x, qix_y = self.qix.get_position()
-            
-            if self.qix.check_collision(player_x, player_y, threshold=15):
-                self.player.cancel_push()
-            elif self.world.check_incursion_collision(qix_x, qix_y, threshold=15):
-                self.player.cancel_push()
-            else:
-                for sparc in self.sparcs:
-                    sparc_x, sparc_y = sparc.get_position()
-                    if sparc.check_collision(player_x, player_y, threshold=10):
-                        self.player.cancel_push()
-                        break
-                    elif self.world.check_incursion_collision(sparc_x, sparc_y, threshold=10):
-                        self.player.cancel_push()
-                        break
-        else:
-            for sparc in self.sparcs:
-                if sparc.check_collision(player_x, player_y, threshold=10):
-                    if self.player.lose_life():
-                        self.player.reset_position()
-                    break
+        positions = self._render_positions
+        sprites = {"player": self.player.get_bounds(pos=positions["player"]), "qix": self.qix.get_bounds(pos=positions["qix"])}
+        for i, sparc in enumerate(self.sparcs):
+            sprites[("sparc", i)] = sparc.get_bounds(pos=positions[("sparc", i)])
+        for key, bounds in sprites.items():
+            dirty.append(pygame.Rect(bounds))
+            if key in self._sprite_rects:
+                dirty.append(self._sprite_rects[key])
+        self._sprite_rects = {key: pygame.Rect(bounds) for key, bounds in sprites.items()}
         
-        self.player.check_push_idle()
+        trail = self.world.current_incursion
+        color = self.world.get_incursion_color()
+        trail_rect = pygame.Rect(self.world.get_incursion_bounds()) if len(trail) > 1 else None
+        if len(trail) < self._drawn_trail_length or color != self._drawn_trail_color:
+            # Trail cleared, restarted or blinking: repaint all of it, and the push marker at its start.
+            dirty.extend(rect.inflate(8, 8) for rect in (self._trail_rect, trail_rect) if rect)
+        elif len(trail) > 1:
+            dirty.append(pygame.Rect(self.world.get_incursion_bounds(max(0, self._drawn_trail_length - 2))))
+        self._trail_rect = trail_rect
+        self._drawn_trail_length = len(trail)
+        self._drawn_trail_color = color
         
-        if not self.player.is_alive():
-            self.game_state = "GAME_OVER"
+        if self.world.boundary_version != self._drawn_boundary_version:
+            if self.world.last_claim_bounds:
+                dirty.append(pygame.Rect(self.world.last_claim_bounds))
+            self._drawn_boundary_version = self.world.boundary_version
         
-        claimed_percentage = self.world.get_claimed_percentage()
-        if claimed_percentage >= self.target_percentage:
-            self.game_state = "LEVEL_COMPLETE"
+        hud = (self.player.lives, f"{self.world.get_claimed_percentage():.1f}", self.level, self.target_percentage)
+        if hud != self._drawn_hud or self.profiler is not None:
+            field_bottom = self.world.y + self.world.height
+            dirty.append(pygame.Rect(0, 0, WINDOW_WIDTH, self.world.y))
+            dirty.append(pygame.Rect(0, field_bottom, WINDOW_WIDTH, WINDOW_HEIGHT - field_bottom))
+            self._drawn_hud = hud
+        return dirty
     
-    def draw(self):
+    def _draw_scene(self):
         self.screen.fill((255, 255, 255))
         
         if self.game_state == "START":
             self._draw_start_screen()
-            pygame.display.flip()
             return
         
         if not self.world:
-            pygame.display.flip()
             return
         
         self.world.draw(self.screen)
         
-        self.player.draw(self.screen)
-        self.qix.draw(self.screen)
-        for sparc in self.sparcs:
-            sparc.draw(self.screen)
+        positions = self._render_positions
+        self.player.draw(self.screen, positions["player"])
+        self.qix.draw(self.screen, positions["qix"])
+        for i, sparc in enumerate(self.sparcs):
+            sparc.draw(self.screen, positions[("sparc", i)])
         
-        lives_text = self.small_font.render(f"Lives: {self.player.lives}", True, (0, 0, 0))
+        lives_text = self._render_text(self.small_font, f"Lives: {self.player.lives}", (0, 0, 0), slot="lives")
         self.screen.blit(lives_text, (10, 10))
         
         claimed_percentage = self.world.get_claimed_percentage()
-        claimed_text = self.small_font.render(f"{claimed_percentage:.1f}% claimed", True, (0, 0, 0))
+        claimed_text = self._render_text(self.small_font, f"{claimed_percentage:.1f}% claimed", (0, 0, 0), slot="claimed")
         self.screen.blit(claimed_text, (10, WINDOW_HEIGHT - 40))
         
-        level_text = self.small_font.render(
-            f"Level {self.level} - {self.target_percentage}% needed", 
-            True, (0, 0, 0)
+        level_text = self._render_text(
+            self.small_font, f"Level {self.level} - {self.target_percentage}% needed", 
+            (0, 0, 0), slot="level"
         )
         text_rect = level_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 30))
         self.screen.blit(level_text, text_rect)
         
         if self.game_state == "LEVEL_COMPLETE":
-            overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-            overlay.set_alpha(200)
-            overlay.fill((0, 0, 0))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(self._dim_overlay(200), (0, 0))
             
-            title_text = self.font.render("Level Complete!", True, (0, 255, 0))
+            title_text = self._render_text(self.font, "Level Complete!", (0, 255, 0))
             title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
             self.screen.blit(title_text, title_rect)
             
-            continue_text = self.small_font.render("Press ENTER to continue", True, (255, 255, 255))
+            continue_text = self._render_text(self.small_font, "Press ENTER to continue", (255, 255, 255))
             continue_rect = continue_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 20))
             self.screen.blit(continue_text, continue_rect)
             
-            quit_text = self.small_font.render("Press ESC to quit", True, (255, 255, 255))
+            quit_text = self._render_text(self.small_font, "Press ESC to quit", (255, 255, 255))
             quit_rect = quit_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 50))
             self.screen.blit(quit_text, quit_rect)
         
         elif self.game_state == "GAME_OVER":
-            overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-            overlay.set_alpha(200)
-            overlay.fill((0, 0, 0))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(self._dim_overlay(200), (0, 0))
             
-            title_text = self.font.render("Game Over!", True, (255, 0, 0))
+            title_text = self._render_text(self.font, "Game Over!", (255, 0, 0))
             title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
             self.screen.blit(title_text, title_rect)
             
-            restart_text = self.small_font.render("Press ENTER to restart", True, (255, 255, 255))
+            restart_text = self._render_text(self.small_font, "Press ENTER to restart", (255, 255, 255))
             restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 20))
             self.screen.blit(restart_text, restart_rect)
             
-            quit_text = self.small_font.render("Press ESC to quit", True, (255, 255, 255))
+            quit_text = self._render_text(self.small_font, "Press ESC to quit", (255, 255, 255))
             quit_rect = quit_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 50))
             self.screen.blit(quit_text, quit_rect)
         elif self.game_state == "PAUSED":
-            overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-            overlay.set_alpha(160)
-            overlay.fill((0, 0, 0))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(self._dim_overlay(160), (0, 0))
             
-            paused_text = self.font.render("Paused", True, (255, 255, 0))
+            paused_text = self._render_text(self.font, "Paused", (255, 255, 0))
             paused_rect = paused_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 20))
             self.screen.blit(paused_text, paused_rect)
             
-            resume_text = self.small_font.render("Press ENTER to resume", True, (255, 255, 255))
+            resume_text = self._render_text(self.small_font, "Press ENTER to resume", (255, 255, 255))
             resume_rect = resume_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 20))
             self.screen.blit(resume_text, resume_rect)
 
-            quit_text = self.small_font.render("Press ESC to quit", True, (255, 255, 255))
+            quit_text = self._render_text(self.small_font, "Press ESC to quit", (255, 255, 255))
             quit_rect = quit_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 50))
             self.screen.blit(quit_text, quit_rect)
         
-        pygame.display.flip()
+        if self.profiler is not None:
+            self._draw_profile_overlay()
+    
+    def _draw_profile_overlay(self):
+        p50, p99 = self.profiler.percentiles(50, 99)
+        profile_text = self._render_text(
+            self.small_font, f"frame p50 {p50:.2f} ms  p99 {p99:.2f} ms", (200, 0, 0), slot="profile"
+        )
+        profile_rect = profile_text.get_rect(topright=(WINDOW_WIDTH - 10, 10))
+        self.screen.blit(profile_text, profile_rect)
+    
+    def _render_text(self, font, text, color, slot=None):
+        """Rendered text, cached per slot (or per static string) and redone only when the text changes."""
+        key = slot if slot is not None else (id(font), text, color)
+        cached = self._text_cache.get(key)
+        if cached is None or cached[0] != text:
+            cached = (text, font.render(text, True, color))
+            self._text_cache[key] = cached
+        return cached[1]
+    
+    def _dim_overlay(self, alpha):
+        overlay = self._overlay_cache.get(alpha)
+        if overlay is None:
+            overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+            overlay.set_alpha(alpha)
+            overlay.fill((0, 0, 0))
+            self._overlay_cache[alpha] = overlay
+        return overlay
     
     def _draw_start_screen(self):
-        title_text = self.font.render("Qix Game", True, (0, 0, 0))
+        title_text = self._render_text(self.font, "Qix Game", (0, 0, 0))
         title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 80))
         self.screen.blit(title_text, title_rect)
         
-        prompt_text = self.small_font.render("Press ENTER to start", True, (0, 0, 0))
+        prompt_text = self._render_text(self.small_font, "Press ENTER to start", (0, 0, 0))
         prompt_rect = prompt_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 20))
         self.screen.blit(prompt_text, prompt_rect)
         
-        pause_text = self.small_font.render("Press ENTER during play to pause/resume", True, (0, 0, 0))
+        pause_text = self._render_text(self.small_font, "Press ENTER during play to pause/resume", (0, 0, 0))
         pause_rect = pause_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 20))
         self.screen.blit(pause_text, pause_rect)
         
-        control_text = self.small_font.render("Arrow keys move, SPACE to start an incursion.", True, (0, 0, 0))
+        control_text = self._render_text(self.small_font, "Arrow keys move, SPACE to start an incursion.", (0, 0, 0))
         control_rect = control_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 60))
         self.screen.blit(control_text, control_rect)
     
     def run(self):
+        profiler = self.profiler
         running = True
+        elapsed_ms = 0
         while running:
+            if profiler is not None:
+                profiler.begin_frame()
             running = self.handle_events()
-            self.update()
+            if profiler is not None:
+                profiler.mark("input")
+            self.advance(elapsed_ms)
             self.draw()
-            self.clock.tick(60)
+            if profiler is not None:
+                profiler.mark("draw")
+                profiler.end_frame()
+            elapsed_ms = self.clock.tick(self.max_fps)
         
+        if profiler is not None:
+            profiler.dump(self.profile_path)
         pygame.quit()
 
 def run_tests():
@@ -370,12 +496,383 @@ def run_tests():
     assert not player.is_pushing
     assert player.get_position() == player.last_edge_pos
     
+    # The run-length grid engine claims exactly the same cells as the bytearray one
+    try:
+        import numpy  # noqa: F401
+    except ModuleNotFoundError:
+        numpy = None
+    engines = [{}, {"use_runs": True}]
+    results = []
+    for engine in engines:
+        world = World(0, 0, 100, 100, **engine)
+        world.start_incursion(30, 0)
+        for point in ((30, 40), (60, 40), (60, 0)):
+            world.add_to_incursion(*point)
+        assert world.complete_incursion((80, 80))
+        claimed = [bytes(bytearray(row)) for row in world.claimed_grid]
+        blocked = [bytes(bytearray(row)) for row in world.blocked_grid]
+        results.append((world.claimed_area, claimed, blocked, world.is_point_claimed(45, 20)))
+    assert all(result == results[0] for result in results), "Grid engines should agree on claimed cells"
+    
+    # Old boundary cut off by a claim is only claimed by the next one, keeping level-completion timing
+    for engine in engines:
+        world = World(0, 0, 100, 100, **engine)
+        world.start_incursion(30, 0)
+        for point in ((30, 40), (60, 40), (60, 0)):
+            world.add_to_incursion(*point)
+        assert world.complete_incursion((80, 80))
+        assert world.claimed_area == 1131 and not world.is_point_claimed(45, 0)
+        world.start_incursion(0, 70)
+        world.add_to_incursion(100, 70)
+        assert world.complete_incursion((80, 80))
+        assert world.claimed_area == 6682 and world.is_point_claimed(45, 0)
+    
+    # Patching the area raster round the last claim matches rebuilding it whole
+    world = World(0, 0, 100, 100, render=False)
+    world.start_incursion(30, 0)
+    for point in ((30, 40), (60, 40), (60, 0)):
+        world.add_to_incursion(*point)
+    assert world.complete_incursion((80, 80))
+    patched = (bytes(world.area_raster), world.free_spans.total)
+    world.last_claim_bounds = None
+    world._refresh_area_raster()
+    assert (bytes(world.area_raster), world.free_spans.total) == patched
+    
+    # Span flood fill reaches exactly the cells a per-cell BFS does, round a concave comb of walls
+    from classes.RunGrid import RunGrid
+    world = World(0, 0, 40, 30, render=False)
+    walls = [bytearray(40) for _ in range(30)]
+    for x in (10, 20, 30):
+        for y in range(25):
+            walls[y][x] = 1
+    for x in range(14, 27):
+        walls[12][x] = 1
+    reached = {(5, 5)}
+    queue = [(5, 5)]
+    for x, y in queue:
+        for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            if 0 <= nx < 40 and 0 <= ny < 30 and not walls[ny][nx] and (nx, ny) not in reached:
+                reached.add((nx, ny))
+                queue.append((nx, ny))
+    run_walls = RunGrid(40, 30)
+    for y, row in enumerate(walls):
+        for x in range(40):
+            if row[x]:
+                run_walls.add(y, x, x + 1)
+    for fill, grid in ((world._flood_fill, walls), (world._flood_fill_runs, run_walls)):
+        spans = []
+        assert fill(grid, 5, 5, spans)
+        filled = [(x, y) for y, start, end in spans for x in range(start, end)]
+        assert len(filled) == len(reached) and set(filled) == reached
+    
+    # EdgeIndex.nearest agrees with a linear scan, ties going to the earliest edge
+    from classes.EdgeIndex import EdgeIndex
+    edges = [(0, 0, 40, 0), (40, 0, 40, 20), (40, 20, 20, 20), (20, 20, 20, 40), (20, 40, 0, 40),
+             (0, 40, 0, 0), (40, 0, 40, 20), (20, 20, 20, 20), (5, 5, 15, 15)]
+    index = EdgeIndex(edges, 0, 0, cell_size=8)
+    
+    def scan_nearest(x, y, max_t):
+        best = None
+        for i, (x1, y1, x2, y2) in enumerate(edges):
+            dx, dy = x2 - x1, y2 - y1
+            if not dx and not dy:
+                continue
+            t = max(0.0, min(max_t, ((x - x1) * dx + (y - y1) * dy) / (dx * dx + dy * dy)))
+            point = (x1 + dx * t, y1 + dy * t)
+            dist = (point[0] - x) ** 2 + (point[1] - y) ** 2
+            if best is None or dist < best[0]:
+                best = (dist, (i, t, point))
+        return best[1]
+    
+    rng = random.Random(2)
+    points = [(x, y) for x in range(-5, 50, 5) for y in range(-5, 50, 5)]
+    points += [(rng.uniform(-10, 50), rng.uniform(-10, 50)) for _ in range(200)]
+    for x, y in points:
+        for max_t in (1.0, 0.999):
+            assert index.nearest(x, y, max_t) == scan_nearest(x, y, max_t), (x, y, max_t)
+    assert index.nearest(40, 10)[0] == 1 and index.nearest(10, 10)[0] == 8
+    
+    # Unclaimed-area queries match the direct edge test and blocked-cell lookup at integer points
+    for engine in engines:
+        world = World(0, 0, 100, 100, render=False, **engine)
+        world.start_incursion(30, 0)
+        for point in ((30, 40), (60, 70), (60, 100)):
+            world.add_to_incursion(*point)
+        assert world.complete_incursion((90, 10))
+        for x in range(-2, 103):
+            for y in range(-2, 103, 3):
+                local_x, local_y = world._to_local_coords(x, y)
+                expected = (
+                    world.is_point_within_bounds(x, y) and not world.is_point_on_edge(x, y)
+                    and not world.blocked_grid[local_y][local_x]
+                )
+                assert world.is_point_in_unclaimed_area(x, y) == expected, (engine, x, y)
+    
+    # A failed claim (Qix on the trail) leaves the boundary and the wall mask untouched
+    for engine in engines:
+        world = World(0, 0, 100, 100, render=False, **engine)
+        boundary = list(world.boundary_path)
+        walls = [bytes(bytearray(row)) for row in world.wall_grid]
+        version = world.boundary_version
+        world.start_incursion(30, 0)
+        for point in ((30, 40), (60, 40), (60, 0)):
+            world.add_to_incursion(*point)
+        assert not world.complete_incursion((30, 20))
+        assert world.boundary_path == boundary and world.boundary_version == version
+        assert [bytes(bytearray(row)) for row in world.wall_grid] == walls
+    
+    # Vector engine takes claimed area exactly from the boundary polygon, at any field size
+    for size in (100, 1_000_000):
+        scale = size // 100
+        world = World(0, 0, size, size, render=False, use_vector=True)
+        world.start_incursion(30 * scale, 0)
+        for point in ((30, 40), (60, 40), (60, 0)):
+            world.add_to_incursion(point[0] * scale, point[1] * scale)
+        assert world.complete_incursion((80 * scale, 80 * scale))
+        assert world.claimed_area == 1200 * scale * scale
+        assert world.is_point_claimed(45 * scale, 20 * scale)
+        assert not world.is_point_in_unclaimed_area(45 * scale, 20 * scale)
+    
+    # Batch collisions report each enemy once, player hits before trail hits, in either code path
+    world = World(0, 0, 100, 100, render=False)
+    world.start_incursion(30, 0)
+    world.add_to_incursion(30, 40)
+    world.add_to_incursion(60, 40)
+    enemies = [(90, 90), (35, 20), (30, 45), (61, 50)] * 3
+    expected = [(1, "trail"), (2, "player"), (5, "trail"), (6, "player"), (9, "trail"), (10, "player")]
+    assert world.check_enemy_collisions(enemies, 10, player_pos=(30, 50)) == expected
+    assert world.check_enemy_collisions(enemies[:4], 10, player_pos=(30, 50)) == expected[:2]
+    
+    # Swept tests catch a fast enemy passing through the player or the trail between ticks
+    assert not world.check_enemy_collisions([(10, 50), (40, 50)], 10, player_pos=(30, 50))
+    assert world.check_swept_collision((10, 50), (40, 50), (30, 50), (30, 50), threshold=10)
+    assert not world.check_incursion_collision(50, 50, threshold=10)
+    assert world.check_swept_incursion_collision((0, 30), (50, 50), threshold=10)
+    assert world.check_enemy_collisions([(50, 50)] * 8, 10, previous_positions=[(0, 30)] * 8) == [
+        (index, "trail") for index in range(8)
+    ]
+    
+    # Straight steps merge into the last trail segment; turns and reversals start a new one
+    world = World(0, 0, 100, 100, render=False)
+    world.start_incursion(0, 50)
+    for point in ((3, 50), (6, 50), (6, 53), (6, 56), (9, 56), (6, 56), (6, 59)):
+        world.add_to_incursion(*point)
+    assert world.current_incursion == [(0, 50), (6, 50), (6, 56), (9, 56), (6, 56), (6, 59)]
+    assert world.incursion_index.edges == [
+        (0, 50, 6, 50), (6, 50, 6, 56), (6, 56, 9, 56), (9, 56, 6, 56), (6, 56, 6, 59),
+    ]
+    
+    # Trail collisions skip the last recorded steps even inside merged segments, as on the raw steps
+    from classes.World import MAX_SKIP_TAIL_SEGMENTS, _point_segment_distance_squared
+    rng = random.Random(6)
+    world = World(0, 0, 200, 200, render=False)
+    world.start_incursion(0, 100)
+    steps = [(0, 100)]
+    direction = (3, 0)
+    for _ in range(60):
+        if rng.random() < 0.3:
+            direction = rng.choice([(direction[1], direction[0]), (-direction[1], -direction[0])])
+        x, y = steps[-1][0] + direction[0], steps[-1][1] + direction[1]
+        if not (3 <= x <= 197 and 3 <= y <= 197):
+            continue
+        steps.append((x, y))
+        world.add_to_incursion(x, y)
+        for skip in range(MAX_SKIP_TAIL_SEGMENTS + 1):
+            segments = list(zip(steps, steps[1:]))[:max(0, len(steps) - 1 - skip)]
+            for px, py in [(x + rng.uniform(-8, 8), y + rng.uniform(-8, 8)) for _ in range(6)]:
+                expected = any(
+                    _point_segment_distance_squared(px, py, x1, y1, x2, y2) < 16
+                    for (x1, y1), (x2, y2) in segments
+                )
+                assert world.check_incursion_collision(px, py, threshold=4, skip_tail_segments=skip) == expected
+    assert len(world.current_incursion) < len(steps)
+    try:
+        world.check_incursion_collision(0, 100, skip_tail_segments=MAX_SKIP_TAIL_SEGMENTS + 1)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Skipping more tail steps than are kept should be refused")
+    
+    # Free-point sampling tracks claims and only ever returns unclaimed points
+    from classes.World import AREA_FREE
+    world = World(0, 0, 100, 100, render=False)
+    world.start_incursion(85, 0)
+    world.add_to_incursion(85, 100)
+    assert world.complete_incursion((95, 50))
+    spans = world.free_spans
+    stride = world.width + 1
+    free = sum(
+        world.area_raster[row * stride + column] == AREA_FREE
+        for row in range(spans.top, spans.bottom + 1) for column in range(spans.left, spans.right + 1)
+    )
+    assert len(spans) == free > 0
+    rng = random.Random(4)
+    assert all(world.is_point_in_unclaimed_area(*world.sample_free_point(rng)) for _ in range(200))
+    
+    # The vector engine samples its boundary polygon as evenly as the raster engines sample spans
+    shares = []
+    for engine in ({}, {"use_vector": True}):
+        world = World(0, 0, 100, 100, render=False, **engine)
+        world.start_incursion(30, 0)
+        for point in ((30, 40), (60, 40), (60, 0)):
+            world.add_to_incursion(*point)
+        assert world.complete_incursion((80, 80))
+        points = [world.sample_free_point(rng) for _ in range(5000)]
+        assert all(10 <= min(point) <= max(point) <= 90 for point in points)
+        assert all(world.is_point_in_unclaimed_area(*point) for point in points)
+        shares.append(sum(y < 40 for _, y in points) / len(points))
+    assert abs(shares[0] - shares[1]) < 0.03, shares
+    
+    # Headless simulation steps on its own tick clock
+    simulation = Simulation(1, 0, 0, 100, 100, render=False)
+    for _ in range(10):
+        assert simulation.step(Command(1, 0)) == "PLAYING"
+    assert simulation.player.get_position() == (30, 0)
+    assert simulation.clock.ticks == 10
+    
+    # The simulation core imports without pygame; a fresh interpreter, as this one already has it
+    import os
+    import subprocess
+    check = "import sys, classes.Simulation; sys.exit('pygame' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", check], cwd=os.path.dirname(os.path.abspath(__file__))).returncode == 0
+    
+    # One second of game time covers the same ground at any simulation rate
+    finals = []
+    for hz in (30, 60, 240):
+        simulation = Simulation(1, 0, 0, 400, 400, clock=TickClock(1000 / hz), render=False, seed=1)
+        for _ in range(hz):
+            simulation.step(Command(1, 0))
+        finals.append((
+            simulation.player.get_position(), simulation.sparcs[0].path_distance, simulation.qix.get_position()
+        ))
+    for player_pos, sparc_distance, qix_pos in finals:
+        assert player_pos == finals[1][0] and abs(player_pos[0] - 180) < 1e-6
+        assert abs(sparc_distance - finals[1][1]) < 1e-6
+        assert abs(qix_pos[0] - finals[1][2][0]) < 1e-6 and abs(qix_pos[1] - finals[1][2][1]) < 1e-6
+    
+    # The same seed replays the same Qix path
+    paths = []
+    for _ in range(2):
+        simulation = Simulation(1, 0, 0, 200, 200, render=False, seed=7)
+        for _ in range(200):
+            simulation.step()
+        paths.append(simulation.qix.get_position())
+    assert paths[0] == paths[1], "Seeded simulations should be reproducible"
+    
+    # Perimeter lookups match the linear scans Sparcs used, zero-length edges and wrap-around included
+    from classes.Perimeter import Perimeter
+    edges = [(0, 0, 0, 0), (0, 0, 40, 0), (40, 0, 40, 0), (40, 0, 40, 30), (40, 30, 10, 30),
+             (10, 30, 10, 30), (10, 30, 0, 30), (0, 30, 0, 0), (0, 0, 0, 0)]
+    perimeter = Perimeter(edges, EdgeIndex(edges, 0, 0, cell_size=8))
+    
+    def scan_locate(distance):
+        distance %= perimeter.total
+        found = 0
+        for i in range(len(edges)):
+            end = perimeter.cumulative_lengths[i + 1]
+            if perimeter.cumulative_lengths[i] <= distance < end or (i == len(edges) - 1 and distance == end):
+                found = i
+                break
+        offset = distance - perimeter.cumulative_lengths[found]
+        t = max(0.0, min(1.0, offset / (perimeter.edge_lengths[found] or 1.0)))
+        x1, y1, x2, y2 = edges[found]
+        return found, t, x1 + (x2 - x1) * t, y1 + (y2 - y1) * t
+    
+    def scan_project(x, y, max_t):
+        best = None
+        for i, (x1, y1, x2, y2) in enumerate(edges):
+            dx, dy = x2 - x1, y2 - y1
+            if not dx and not dy:
+                continue
+            t = max(0.0, min(max_t, ((x - x1) * dx + (y - y1) * dy) / (dx * dx + dy * dy)))
+            point = (x1 + dx * t, y1 + dy * t)
+            dist = (point[0] - x) ** 2 + (point[1] - y) ** 2
+            if best is None or dist < best[0]:
+                best = (dist, (i, t, point, perimeter.cumulative_lengths[i] + t * perimeter.edge_lengths[i]))
+        return best[1]
+    
+    assert perimeter.total == 140
+    distances = list(perimeter.cumulative_lengths) + [-1, -140, 0.5, 139.5, 140, 280, 300.25]
+    rng = random.Random(3)
+    distances += [rng.uniform(-200, 400) for _ in range(200)]
+    for distance in distances:
+        assert perimeter.locate(distance) == scan_locate(distance), distance
+    for x in range(-4, 46, 2):
+        for y in range(-4, 36, 2):
+            for max_t in (1.0, 0.999):
+                assert perimeter.project(x, y, max_t) == scan_project(x, y, max_t), (x, y, max_t)
+    
+    # Pooled Sparcs move exactly like individual ones
+    if numpy is not None:
+        positions = []
+        for pooled in (False, True):
+            simulation = Simulation(3, 0, 0, 200, 200, render=False, seed=3, sparc_count=5, sparc_pool=pooled)
+            for _ in range(300):
+                simulation.step()
+            positions.append([sparc.get_position() for sparc in simulation.sparcs])
+        assert positions[0] == positions[1], "SparcPool should match per-object Sparcs"
+    
+    # Profiler books claims separately from the phase they happen in
+    ticks = iter(range(100))
+    profiler = FrameProfiler(timer=lambda: next(ticks))
+    world = World(0, 0, 100, 100, render=False)
+    world.profiler = profiler
+    profiler.begin_frame()
+    world.start_incursion(30, 0)
+    for point in ((30, 40), (60, 40), (60, 0)):
+        world.add_to_incursion(*point)
+    assert world.complete_incursion((80, 80))
+    profiler.mark("player")
+    profiler.end_frame()
+    _, total, phases = profiler.frames[0]
+    assert phases["claim"] == 1 and phases["player"] == 2 and total == 4
+    assert profiler.claims[0][2:] == (world.claimed_area, len(world.boundary_path))
+    assert profiler.percentiles(0, 99) == [4000, 4000]
+    profiler.begin_frame()
+    profiler.end_frame()
+    assert profiler.percentiles(0, 99) == [1000, 4000], "Percentiles should follow newly recorded frames"
+    
+    # Dirty rects cover the old and new sprite boxes and the claim; needs real pygame, not the stub above
+    if hasattr(pygame, "__file__"):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        rects = [pygame.Rect(0, 0, 10, 10), pygame.Rect(11, 0, 5, 5), pygame.Rect(40, 40, 4, 4),
+                 pygame.Rect(100, 0, 3, 3), pygame.Rect(5, 5, 50, 2)]
+        merged = Game._merge_rects(rects)
+        assert all(any(rect.contains(part) for rect in merged) for part in rects)
+        assert all(rect.inflate(4, 4).collidelist(merged[i + 1:]) == -1 for i, rect in enumerate(merged))
+        
+        game = Game()
+        game._init_level()
+        game.game_state = "PLAYING"
+        game.draw()
+        old_boxes = list(game._sprite_rects.values())
+        for _ in range(5):
+            game.update()
+        world = game.world
+        world.start_incursion(world.x + 40, world.y)
+        for point in ((40, 40), (80, 40), (80, 0)):
+            world.add_to_incursion(world.x + point[0], world.y + point[1])
+        assert world.complete_incursion(game.qix.get_position())
+        game._render_positions = game._interpolate_positions()
+        merged = Game._merge_rects(game._collect_dirty_rects())
+        new_boxes = [pygame.Rect(game.player.get_bounds(pos=game._render_positions["player"])),
+                     pygame.Rect(game.qix.get_bounds(pos=game._render_positions["qix"]))]
+        new_boxes += [pygame.Rect(sparc.get_bounds(pos=game._render_positions[("sparc", i)]))
+                      for i, sparc in enumerate(game.sparcs)]
+        assert new_boxes[1] not in old_boxes
+        for box in old_boxes + new_boxes + [pygame.Rect(world.last_claim_bounds)]:
+            assert any(rect.contains(box) for rect in merged), box
+        pygame.quit()
+    
     print("All gameplay tests passed.")
 
 if __name__ == "__main__":
     import sys
     if len(sys.argv) > 1 and sys.argv[1] == "--test":
         run_tests()
+    elif len(sys.argv) > 1 and sys.argv[1] == "--profile":
+        game = Game(profile_path=sys.argv[2] if len(sys.argv) > 2 else "frame_trace.json")
+        game.run()
     else:
         game = Game()
         game.run()
@@ -4,3 +4,6 @@ from classes.Player import Player
 from classes.Enemy import Enemy
 from classes.Qix import Qix
 from classes.Sparc import Sparc
+from classes.Simulation import Simulation, Command
+from classes.TickClock import TickClock
+from classes.FrameProfiler import FrameProfiler
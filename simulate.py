@@ -0,0 +1,145 @@
+"""Run batches of scripted, display-free episodes across all CPU cores.
+
+    python3 simulate.py --levels 1-5 --episodes 200 --max-ticks 20000
+"""
+import argparse
+import os
+import random
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from classes.Simulation import Simulation, Command
+
+FIELD_X = 50
+FIELD_Y = 50
+FIELD_WIDTH = 700
+FIELD_HEIGHT = 450
+
+DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+def scripted_commands(simulation, rng):
+    """Seeded player that walks the edge, then traces a box into the unclaimed field."""
+    player = simulation.player
+    world = simulation.world
+    while True:
+        along = rng.choice(DIRECTIONS)
+        for _ in range(rng.randint(5, 60)):
+            yield Command(*along)
+        if player.is_pushing:
+            continue
+
+        inward = [
+            (dx, dy) for dx, dy in DIRECTIONS
+            if world.is_point_in_unclaimed_area(player.x + dx * 6, player.y + dy * 6)
+        ]
+        if not inward:
+            continue
+        dx, dy = rng.choice(inward)
+        side = rng.choice(((dy, dx), (-dy, -dx)))
+
+        yield Command(dx, dy, push=True)
+        for _ in range(rng.randint(5, 40)):
+            if not player.is_pushing:
+                break
+            yield Command(dx, dy)
+        for _ in range(rng.randint(5, 60)):
+            if not player.is_pushing:
+                break
+            yield Command(*side)
+        for _ in range(400):
+            if not player.is_pushing:
+                break
+            yield Command(-dx, -dy)
+
+def run_episode(level, seed, max_ticks):
+    simulation = Simulation(level, FIELD_X, FIELD_Y, FIELD_WIDTH, FIELD_HEIGHT, render=False, seed=seed)
+    commands = scripted_commands(simulation, random.Random(simulation.world.rng.getrandbits(64)))
+    state = simulation.state
+    while state == "PLAYING" and simulation.clock.ticks < max_ticks:
+        state = simulation.step(next(commands))
+    return {
+        "level": level,
+        "seed": seed,
+        "outcome": state if state != "PLAYING" else "TIMEOUT",
+        "ticks": simulation.clock.ticks,
+        "claimed_percentage": simulation.world.get_claimed_percentage(),
+        "claims": simulation.world.claim_count,
+        "deaths": dict(simulation.deaths),
+    }
+
+def simulate(levels, episodes, max_ticks=20000, workers=None, base_seed=0):
+    """Yield episode results as they finish, spreading seeded runs over a process pool."""
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = [
+            pool.submit(run_episode, level, base_seed + level * episodes + i, max_ticks)
+            for level in levels
+            for i in range(episodes)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+def summarize(results):
+    by_level = defaultdict(list)
+    for result in results:
+        by_level[result["level"]].append(result)
+
+    summary = {}
+    for level, runs in sorted(by_level.items()):
+        completed = [run for run in runs if run["outcome"] == "LEVEL_COMPLETE"]
+        total_ticks = sum(run["ticks"] for run in runs)
+        deaths = Counter()
+        for run in runs:
+            deaths.update(run["deaths"])
+        summary[level] = {
+            "episodes": len(runs),
+            "completion_rate": len(completed) / len(runs),
+            "game_over_rate": sum(run["outcome"] == "GAME_OVER" for run in runs) / len(runs),
+            "mean_ticks_to_complete": sum(run["ticks"] for run in completed) / len(completed) if completed else None,
+            "claims_per_1000_ticks": 1000 * sum(run["claims"] for run in runs) / max(total_ticks, 1),
+            "claimed_percent_per_1000_ticks": 1000 * sum(run["claimed_percentage"] for run in runs) / max(total_ticks, 1),
+            "deaths_by_cause": dict(deaths),
+        }
+    return summary
+
+def _parse_levels(text):
+    if "-" in text:
+        first, last = text.split("-", 1)
+        return list(range(int(first), int(last) + 1))
+    return [int(level) for level in text.split(",")]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--levels", default="1-5", help="level range like 1-5 or a list like 1,3")
+    parser.add_argument("--episodes", type=int, default=50, help="episodes per level")
+    parser.add_argument("--max-ticks", type=int, default=20000, help="tick budget per episode")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0, help="base seed for the whole batch")
+    args = parser.parse_args(argv)
+
+    results = []
+    for result in simulate(_parse_levels(args.levels), args.episodes, args.max_ticks, args.workers, args.seed):
+        results.append(result)
+        print(
+            f"level {result['level']} seed {result['seed']}: {result['outcome']} after {result['ticks']} ticks, "
+            f"{result['claimed_percentage']:.1f}% claimed",
+            flush=True,
+        )
+
+    for level, stats in summarize(results).items():
+        mean_ticks = stats["mean_ticks_to_complete"]
+        print(
+            f"\nLevel {level}: {stats['episodes']} episodes, "
+            f"{stats['completion_rate']:.0%} complete, {stats['game_over_rate']:.0%} game over"
+        )
+        print(f"  ticks to complete: {mean_ticks:.0f}" if mean_ticks is not None else "  ticks to complete: n/a")
+        print(
+            f"  claim rate: {stats['claims_per_1000_ticks']:.2f} claims, "
+            f"{stats['claimed_percent_per_1000_ticks']:.2f}% per 1000 ticks"
+        )
+        deaths = ", ".join(f"{cause} {count}" for cause, count in sorted(stats["deaths_by_cause"].items()))
+        print(f"  deaths: {deaths or 'none'}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())